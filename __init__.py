@@ -12,110 +12,205 @@ bl_info = {
 }
 
 import bpy # type: ignore
+import bpy.utils.previews # type: ignore
 import sys
 import os
 import importlib
+import hashlib
 import subprocess
-import pkg_resources
+from collections import deque
+from importlib.metadata import distribution, PackageNotFoundError
 
 required_packages = {
     'numpy': 'numpy>=1.20.0',
-    'moviepy': 'moviepy>=1.0.3',
-    'pillow': 'pillow>=8.0.0'
+    'moviepy': 'moviepy>=1.0.3'
 }
 
+# Add-on directories, resolved once at import
+addon_dir = os.path.dirname(__file__)
+icons_dir = os.path.join(addon_dir, "icons")
+previews_dir = os.path.join(addon_dir, "previews")
+
+# Written once every dependency is known to be present; keyed on the Python and
+# Blender versions and the package list so an upgrade triggers a fresh check
+deps_key = hashlib.sha1(repr((sys.version_info[:2], bpy.app.version, sorted(required_packages.items()))).encode()).hexdigest()
+deps_stamp = os.path.join(addon_dir, f".deps-{deps_key}.ok")
+
+# Packages reported missing by the last dependency check
+missing_packages = []
+
+# stderr of the last failed pip call, shown to the user
+last_pip_error = ""
+
+# Lines of pip output kept for the error report
+pip_output_lines = 20
+
 def install_pip():
+    """Bootstrap pip with ensurepip, only when Blender's Python doesn't already ship it"""
+    global last_pip_error
     try:
-        subprocess.check_call([sys.executable, "-m", "ensurepip"])
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
+        distribution('pip')
         return True
-    except:
-        return False
-
-def install_package(package_name):
+    except PackageNotFoundError:
+        pass
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", required_packages[package_name]])
+        subprocess.run([sys.executable, "-m", "ensurepip"], check=True, capture_output=True, text=True)
+        subprocess.run([sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input", "--upgrade", "pip"], check=True, capture_output=True, text=True)
         return True
-    except:
+    except subprocess.CalledProcessError as e:
+        last_pip_error = e.stderr.strip()
+        return False
+    except FileNotFoundError as e:
+        last_pip_error = str(e)
         return False
 
 def check_dependencies():
-    missing = []
+    # Skip the probe entirely if a previous run already confirmed the packages
+    if os.path.exists(deps_stamp):
+        missing_packages.clear()
+        return True, "cached"
+    
+    # Metadata lookup only, so heavy packages like numpy are not imported here
+    missing_packages.clear()
     for pkg in required_packages:
         try:
-            importlib.import_module(pkg)
-        except ImportError:
-            missing.append(pkg)
-    if missing:
-        # Try to install missing packages automatically
-        if not install_pip():
-            raise ImportError("Failed to install pip. Please install pip manually.")
-        for pkg in missing:
-            if not install_package(pkg):
-                raise ImportError(f"Failed to install {pkg}. Please install it manually.")
+            distribution(pkg)
+        except PackageNotFoundError:
+            missing_packages.append(pkg)
+    if missing_packages:
+        return False, f"Missing packages: {', '.join(missing_packages)}"
+    
+    try:
+        open(deps_stamp, 'w').close()
+    except OSError:
+        pass
     return True, "All dependencies are satisfied"
 
-# Import modules
-from . import animation_presets
-from . import curve_animation
-from . import utils
+class ANIM_OT_install_deps(bpy.types.Operator):
+    """Install the missing Python packages required by the add-on"""
+    bl_idname = "anim.install_deps"
+    bl_label = "Install Missing Packages"
 
-# List of modules to register/unregister
-modules = [animation_presets, curve_animation, utils]
+    def execute(self, context):
+        if not install_pip():
+            self.report({'ERROR'}, f"Failed to install pip. Please install pip manually.\n{last_pip_error}")
+            return {'CANCELLED'}
+        
+        # Install everything in one pip run so the resolver only starts once
+        packages = [required_packages[pkg] for pkg in missing_packages]
+        wm = context.window_manager
+        wm.progress_begin(0, len(packages))
+        try:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "pip", "install", "--disable-pip-version-check", "--no-input", "--prefer-binary", *packages],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True
+            )
+            collected = 0
+            output = deque(maxlen=pip_output_lines)
+            for line in process.stdout:
+                output.append(line)
+                if line.startswith("Collecting"):
+                    collected += 1
+                    wm.progress_update(min(collected, len(packages)))
+            returncode = process.wait()
+        except OSError as e:
+            self.report({'ERROR'}, f"Failed to run pip: {str(e)}")
+            return {'CANCELLED'}
+        finally:
+            wm.progress_end()
+        
+        if returncode != 0:
+            self.report({'ERROR'}, f"Failed to install packages:\n{''.join(output).strip()}")
+            return {'CANCELLED'}
+        
+        success, message = check_dependencies()
+        if success and not modules:
+            message += ", re-enable the add-on to load it"
+        self.report({'INFO'} if success else {'ERROR'}, message)
+        return {'FINISHED'} if success else {'CANCELLED'}
+
+# Modules to register/unregister, imported on enable rather than at load time.
+# They load numpy along with them; moviepy's ffmpeg is only looked up when previews are optimized.
+module_names = ("animation_presets", "curve_animation", "utils")
+modules = ()
+modules_reversed = ()
+
+# Set JACKIMATION_DEV=1 to reload the modules on every enable while developing
+dev_mode = os.environ.get("JACKIMATION_DEV") == "1"
 
 # Initialize preview collections dictionary
 preview_collections = {}
 
+def update_assets_folder(self, context):
+    # utils caches the resolved folder, it isn't loaded while dependencies are missing
+    if not modules:
+        return
+    from . import utils
+    utils.clear_assets_folder_cache()
+
 class AnimationAddonPreferences(bpy.types.AddonPreferences):
     bl_idname = "Jackimation_addon"
 
     assets_folder: bpy.props.StringProperty(
         name="Select Assets Folder",
         subtype='DIR_PATH',
-        default=""
+        default="",
+        update=update_assets_folder
     ) # type: ignore
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "assets_folder")
+        
+        if missing_packages:
+            box = layout.box()
+            box.label(text=f"Missing packages: {', '.join(missing_packages)}", icon='ERROR')
+            box.operator(ANIM_OT_install_deps.bl_idname, text="Install missing packages", icon='IMPORT')
 
 def register():
     """Register all modules when enabling the add-on."""
-    # Check dependencies first
+    global modules, modules_reversed
+    
+    # The preferences and install operator come first, they need none of the dependencies
+    bpy.utils.register_class(ANIM_OT_install_deps)
+    bpy.utils.register_class(AnimationAddonPreferences)
+    
+    # Check dependencies first; missing ones are installed from the preferences.
+    # The modules import numpy at load time, so they are left out until then.
     success, message = check_dependencies()
     if not success:
-        raise ImportError(f"Dependency Error: {message}")
+        print(f"Dependency Error: {message}")
+        modules = modules_reversed = ()
+        return
     
-    # First, register all modules
+    # Import and register all modules
+    modules = tuple(importlib.import_module(f".{name}", __package__) for name in module_names)
+    modules_reversed = modules[::-1]
     for module in modules:
-        importlib.reload(module)
+        if dev_mode:
+            importlib.reload(module)
         module.register()
     
-    # Create preview collection for icons
-    pcoll = bpy.utils.previews.new()
-    icons_dir = os.path.join(os.path.dirname(__file__), "icons")
+    # Create preview collection for icons once and reuse it on re-enable
+    if "main" not in preview_collections:
+        preview_collections["main"] = bpy.utils.previews.new()
     
     # Create icons directory if it doesn't exist
-    if not os.path.exists(icons_dir):
-        os.makedirs(icons_dir)
-    
-    # Store preview collection
-    preview_collections["main"] = pcoll
+    os.makedirs(icons_dir, exist_ok=True)
     
     # Try to remove redundant panel
+    from . import utils
     utils.remove_redundant_panel()
     
     # Create previews directory if it doesn't exist
-    previews_dir = os.path.join(os.path.dirname(__file__), "previews")
-    if not os.path.exists(previews_dir):
-        os.makedirs(previews_dir)
-    
-    bpy.utils.register_class(AnimationAddonPreferences)
+    os.makedirs(previews_dir, exist_ok=True)
 
 def unregister():
     """Unregister all modules when disabling the add-on."""
     # Unregister in reverse order
-    for module in reversed(modules):
+    for module in modules_reversed:
         module.unregister()
     
     # Clear preview collections
@@ -124,6 +219,7 @@ def unregister():
     preview_collections.clear()
 
     bpy.utils.unregister_class(AnimationAddonPreferences)
+    bpy.utils.unregister_class(ANIM_OT_install_deps)
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -1,6 +1,19 @@
 import bpy
+from array import array
 from mathutils import Vector
 
+# Some Blender builds accept the interpolation directly in keyframe_points.add()
+add_accepts_interpolation = 'interpolation' in bpy.types.FCurveKeyframePoints.bl_rna.functions['add'].parameters
+
+# Integer value of the 'LINEAR' keyframe interpolation, looked up on first use
+linear_enum = None
+
+def get_linear_enum():
+    global linear_enum
+    if linear_enum is None:
+        linear_enum = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items['LINEAR'].value
+    return linear_enum
+
 class ANIM_OT_animate_along_curve(bpy.types.Operator):
     """Animate selected object along a chosen curve"""
     bl_idname = "anim.animate_along_curve"
@@ -34,10 +47,10 @@ class ANIM_OT_animate_along_curve(bpy.types.Operator):
             return {'CANCELLED'}
             
         try:
-            # Remove any existing follow path constraints
-            for c in obj.constraints:
-                if c.type == 'FOLLOW_PATH':
-                    obj.constraints.remove(c)
+            # Remove the follow path constraint added by a previous run
+            existing = obj.constraints.get("Follow Path")
+            if existing and existing.type == 'FOLLOW_PATH':
+                obj.constraints.remove(existing)
             
             # Add new follow path constraint
             constraint = obj.constraints.new(type='FOLLOW_PATH')
@@ -46,38 +59,43 @@ class ANIM_OT_animate_along_curve(bpy.types.Operator):
             constraint.use_curve_follow = auto_orient
             constraint.forward_axis = 'Y'  # Forward axis (can be made configurable)
             constraint.up_axis = 'Z'       # Up axis (can be made configurable)
+            data_path = f'constraints["{constraint.name}"].offset_factor'
             
-            # Ensure the curve is properly set up
-            curve.data.use_path = True
-            curve.data.path_duration = end_frame - start_frame
+            # Ensure the curve is properly set up, only touching values that changed
+            curve_data = curve.data
+            if not curve_data.use_path:
+                curve_data.use_path = True
+            path_duration = end_frame - start_frame
+            if curve_data.path_duration != path_duration:
+                curve_data.path_duration = path_duration
             
             # Animate the offset factor
-            if not obj.animation_data:
-                obj.animation_data_create()
+            anim_data = obj.animation_data or obj.animation_data_create()
+            action = anim_data.action
+            if action is None:
+                action = bpy.data.actions.new(name=f"{obj.name}_FollowPath")
+                anim_data.action = action
                 
             # Clear any existing animation on the offset
-            fcurves = obj.animation_data.action.fcurves if obj.animation_data.action else None
-            if fcurves:
-                for fc in fcurves:
-                    if fc.data_path == f'constraints["{constraint.name}"].offset_factor':
-                        obj.animation_data.action.fcurves.remove(fc)
-            
-            # Set keyframes for the offset
-            constraint.offset_factor = 0.0
-            constraint.keyframe_insert(data_path="offset_factor", frame=start_frame)
-            
-            constraint.offset_factor = 1.0
-            constraint.keyframe_insert(data_path="offset_factor", frame=end_frame)
+            fcurves = action.fcurves
+            fc = fcurves.find(data_path)
+            if fc:
+                fcurves.remove(fc)
             
-            # Set interpolation to linear for smooth motion
-            if obj.animation_data.action:
-                for fc in obj.animation_data.action.fcurves:
-                    if fc.data_path == f'constraints["{constraint.name}"].offset_factor':
-                        for kf in fc.keyframe_points:
-                            kf.interpolation = 'LINEAR'
+            # Key the offset from 0.0 to 1.0 in a single batched write
+            fc = fcurves.new(data_path=data_path, index=0, action_group="Follow Path")
+            if add_accepts_interpolation:
+                fc.keyframe_points.add(2, interpolation='LINEAR')
+            else:
+                fc.keyframe_points.add(2)
+                # Set interpolation to linear for smooth motion
+                fc.keyframe_points.foreach_set('interpolation', array('i', [get_linear_enum()] * 2))
+            # The handles are recalculated by update() and unused on a linear segment
+            fc.keyframe_points.foreach_set('co', array('f', (start_frame, 0.0, end_frame, 1.0)))
+            fc.update()
             
-            # Update the viewport
-            context.view_layer.update()
+            # Tag the object, the depsgraph picks it up once the operator returns
+            obj.update_tag(refresh={'OBJECT'})
             
             self.report({'INFO'}, "Successfully applied curve animation!")
             return {'FINISHED'}
@@ -4,20 +4,208 @@
 
 import bpy # type: ignore
 import math
+import numpy as np
 from bpy.types import Panel, Operator, PropertyGroup # type: ignore
 from bpy.props import BoolProperty, EnumProperty, IntProperty, FloatProperty, FloatVectorProperty, PointerProperty, StringProperty # type: ignore
 from . import utils  # Import utility functions
 import os
+import functools
+import time
+
+# Keyframe tables for the presets, built once at import. Each row starts with the
+# keyframe time as a fraction of the animation duration; angles are in radians.
+
+# (time, scale)
+POPUP_SCALE_KEYFRAMES = (
+    (0.0, (0.0, 0.0, 0.0)),         # Start: invisible
+    (0.4, (1.2, 1.2, 1.2)),         # Overshoot at 40%
+    (0.7, (0.9, 0.9, 0.9)),         # Undershoot at 70%
+    (1.0, (1.0, 1.0, 1.0))          # Final position
+)
+
+# (time, x offset, alpha, scale)
+FADE_SLIDE_KEYFRAMES = (
+    (0.0, -2.0, 0.0, (0.9, 0.9, 0.9)),    # Start: offset left, invisible, slightly scaled down
+    (0.3, -1.0, 0.4, (0.95, 0.95, 0.95)), # Starting to appear
+    (0.7, -0.2, 0.8, (1.1, 1.1, 1.1)),    # Almost there, slight overshoot
+    (1.0, 0.0, 1.0, (1.0, 1.0, 1.0))      # Final position
+)
+
+# (time, scale, z rotation offset)
+BOUNCY_REVEAL_KEYFRAMES = (
+    (0.0, (0.0, 0.0, 0.0), 0.0),                   # Start: invisible
+    (0.3, (1.3, 1.3, 1.3), math.radians(15)),      # First overshoot with slight rotation
+    (0.5, (0.7, 0.7, 0.7), math.radians(-10)),     # First undershoot with counter-rotation
+    (0.7, (1.1, 1.1, 1.1), math.radians(5)),       # Second overshoot
+    (0.85, (0.9, 0.9, 0.9), math.radians(-2)),     # Second undershoot
+    (1.0, (1.0, 1.0, 1.0), 0.0)                    # Final position
+)
+
+# (time, z rotation offset, scale)
+ROTATE_POP_KEYFRAMES = (
+    (0.0, 0.0, (0.0, 0.0, 0.0)),                  # Start: invisible
+    (0.2, math.radians(90), (0.8, 0.8, 0.8)),     # Quarter turn, starting to appear
+    (0.5, math.radians(270), (1.2, 1.2, 1.2)),    # Three-quarter turn, overshoot scale
+    (0.7, math.radians(330), (0.9, 0.9, 0.9)),    # Nearly complete, slight undershoot
+    (1.0, math.radians(360), (1.0, 1.0, 1.0))     # Final position
+)
+
+# (time, height, scale)
+BOUNCE_IN_KEYFRAMES = (
+    (0.0, -5.0, (0.9, 0.9, 1.3)),    # Start: stretched
+    (0.3, 0.0, (1.2, 1.2, 0.8)),     # First impact: squashed
+    (0.5, 2.0, (0.9, 0.9, 1.2)),     # First bounce peak: stretched
+    (0.7, 0.0, (1.1, 1.1, 0.9)),     # Second impact: less squashed
+    (0.85, 0.8, (0.95, 0.95, 1.1)),  # Small bounce
+    (1.0, 0.0, (1.0, 1.0, 1.0))      # Final rest position
+)
+
+# (time, x offset, z rotation offset, scale)
+SLIDE_FROM_SIDE_KEYFRAMES = (
+    (0.0, -3.0, math.radians(-15), (0.8, 0.8, 0.8)),     # Start: offset left, tilted, small
+    (0.3, -2.0, math.radians(-10), (0.9, 0.9, 1.1)),     # Moving right, starting to straighten
+    (0.6, -0.5, math.radians(-5), (1.1, 1.1, 0.9)),      # Almost there, slight tilt
+    (0.8, 0.2, math.radians(2), (1.05, 1.05, 1.05)),     # Overshoot position
+    (0.9, 0.1, math.radians(1), (0.95, 0.95, 0.95)),     # Settling back
+    (1.0, 0.0, 0.0, (1.0, 1.0, 1.0))                     # Final position
+)
+
+# (time, height, scale)
+FALL_FROM_SKY_KEYFRAMES = (
+    (0.0, 10.0, (0.8, 0.8, 1.4)),     # Start high up, stretched
+    (0.3, -0.2, (1.4, 1.4, 0.6)),     # First impact, heavily squashed
+    (0.5, 2.0, (0.9, 0.9, 1.2)),      # First bounce peak
+    (0.7, -0.1, (1.2, 1.2, 0.8)),     # Second impact
+    (0.85, 0.5, (0.95, 0.95, 1.1)),   # Small bounce
+    (0.92, 0.0, (1.1, 1.1, 0.9)),     # Final small impact
+    (1.0, 0.0, (1.0, 1.0, 1.0))       # Rest position
+)
+
+# (time, x rotation offset, scale, y offset)
+FLIP_REVEAL_KEYFRAMES = (
+    (0.0, 0.0, (0.0, 0.0, 0.0), 0.0),                    # Start: invisible
+    (0.2, math.radians(45), (0.6, 0.6, 0.6), 0.2),       # Starting to appear and flip
+    (0.5, math.radians(135), (1.2, 1.2, 1.2), -0.1),     # Mid-flip, overshoot scale
+    (0.7, math.radians(160), (0.9, 0.9, 0.9), 0.05),     # Nearly complete
+    (0.85, math.radians(175), (1.1, 1.1, 1.1), -0.02),   # Final approach
+    (1.0, math.radians(180), (1.0, 1.0, 1.0), 0.0)       # Final position
+)
+
+# (time, scale, x offset, z rotation)
+TYPEWRITER_KEYFRAMES = (
+    (0.0, (0.0, 0.0, 0.0), -0.5, math.radians(10)),    # Start: invisible, offset left, rotated
+    (0.2, (0.7, 0.7, 0.7), -0.3, math.radians(5)),     # Appearing, moving right
+    (0.5, (1.1, 1.1, 1.1), -0.1, math.radians(-3)),    # Overshoot
+    (0.7, (0.9, 0.9, 0.9), 0.0, math.radians(2)),      # Settling
+    (1.0, (1.0, 1.0, 1.0), 0.0, 0.0)                   # Final position
+)
+
+# (time, scale, z rotation offset)
+PULSE_KEYFRAMES = (
+    (0.0, (1.0, 1.0, 1.0), 0.0),                   # Start: normal size
+    (0.2, (1.3, 1.3, 0.8), math.radians(2)),       # Quick expand horizontally, compress vertically
+    (0.4, (0.8, 0.8, 1.3), math.radians(-2)),      # Contract horizontally, expand vertically
+    (0.6, (1.2, 1.2, 0.9), math.radians(1)),       # Second pulse, smaller
+    (0.8, (0.9, 0.9, 1.1), math.radians(-1)),      # Final contraction
+    (1.0, (1.0, 1.0, 1.0), 0.0)                    # Return to normal
+)
+
+# (time, scale)
+ELASTIC_KEYFRAMES = (
+    (0.0, (0.0, 0.0, 0.0)),     # Start
+    (0.2, (1.5, 1.5, 1.5)),     # First overshoot
+    (0.4, (0.7, 0.7, 0.7)),     # First undershoot
+    (0.6, (1.2, 1.2, 1.2)),     # Second overshoot
+    (0.8, (0.9, 0.9, 0.9)),     # Second undershoot
+    (0.9, (1.05, 1.05, 1.05)),  # Final small overshoot
+    (1.0, (1.0, 1.0, 1.0))      # Settle
+)
+
+# (time, scale, x offset, z rotation) for a single staggered element
+STAGGER_KEYFRAMES = (
+    (0.0, (0.0, 0.0, 0.0), -0.3, math.radians(10)),    # Start: invisible, offset, rotated
+    (0.3, (1.2, 1.2, 0.8), -0.1, math.radians(-5)),    # Appear with overshoot
+    (0.5, (0.9, 0.9, 1.1), 0.0, math.radians(2)),      # Undershoot
+    (0.7, (1.1, 1.1, 0.9), 0.0, math.radians(-1)),     # Second overshoot
+    (1.0, (1.0, 1.0, 1.0), 0.0, 0.0)                   # Final state
+)
+
+def keyframe_columns(table):
+    """
+    Split a keyframe table into one NumPy array per column. Times stay float64 so frame
+    rounding is unchanged, values become float32 and vector columns are stored channel
+    first (one contiguous row per fcurve), the layout foreach_set consumes.
+    """
+    times, *columns = zip(*table)
+    return (np.array(times),) + tuple(np.ascontiguousarray(np.array(column, dtype=np.float32).T) for column in columns)
+
+def offset_keyframe_values(base, axis, offsets):
+    """Repeat a vector (e.g. the start location) once per keyframe and offset one of its axes"""
+    values = np.repeat(np.array(base, dtype=np.float32)[:, np.newaxis], len(offsets), axis=1)
+    values[axis] += offsets
+    return values
+
+def replace_keyframe_values(base, axis, column):
+    """Repeat a vector once per keyframe and replace one of its axes with absolute values"""
+    values = np.repeat(np.array(base, dtype=np.float32)[:, np.newaxis], len(column), axis=1)
+    values[axis] = column
+    return values
+
+# Per-column arrays of the tables above, so the keyframe schedules are
+# computed with vectorized arithmetic instead of per-row Python loops
+POPUP_SCALE_TIMES, POPUP_SCALE_SCALES = keyframe_columns(POPUP_SCALE_KEYFRAMES)
+FADE_SLIDE_TIMES, FADE_SLIDE_X_OFFSETS, FADE_SLIDE_ALPHAS, FADE_SLIDE_SCALES = keyframe_columns(FADE_SLIDE_KEYFRAMES)
+BOUNCY_REVEAL_TIMES, BOUNCY_REVEAL_SCALES, BOUNCY_REVEAL_ROT_OFFSETS = keyframe_columns(BOUNCY_REVEAL_KEYFRAMES)
+ROTATE_POP_TIMES, ROTATE_POP_ANGLES, ROTATE_POP_SCALES = keyframe_columns(ROTATE_POP_KEYFRAMES)
+BOUNCE_IN_TIMES, BOUNCE_IN_HEIGHTS, BOUNCE_IN_SCALES = keyframe_columns(BOUNCE_IN_KEYFRAMES)
+SLIDE_FROM_SIDE_TIMES, SLIDE_FROM_SIDE_X_OFFSETS, SLIDE_FROM_SIDE_ROT_OFFSETS, SLIDE_FROM_SIDE_SCALES = keyframe_columns(SLIDE_FROM_SIDE_KEYFRAMES)
+FALL_FROM_SKY_TIMES, FALL_FROM_SKY_HEIGHTS, FALL_FROM_SKY_SCALES = keyframe_columns(FALL_FROM_SKY_KEYFRAMES)
+FLIP_REVEAL_TIMES, FLIP_REVEAL_ANGLES, FLIP_REVEAL_SCALES, FLIP_REVEAL_Y_OFFSETS = keyframe_columns(FLIP_REVEAL_KEYFRAMES)
+TYPEWRITER_TIMES, TYPEWRITER_SCALES, TYPEWRITER_X_OFFSETS, TYPEWRITER_ROT_Z = keyframe_columns(TYPEWRITER_KEYFRAMES)
+PULSE_TIMES, PULSE_SCALES, PULSE_ROT_OFFSETS = keyframe_columns(PULSE_KEYFRAMES)
+ELASTIC_TIMES, ELASTIC_SCALES = keyframe_columns(ELASTIC_KEYFRAMES)
+STAGGER_TIMES, STAGGER_SCALES, STAGGER_X_OFFSETS, STAGGER_ROT_Z = keyframe_columns(STAGGER_KEYFRAMES)
+
+# Per stagger copy (20% delay between each), the delayed times and values of the
+# keyframes that still fall within the duration
+STAGGER_COPIES = 3
+STAGGER_SCHEDULES = tuple(
+    (adjusted_times[in_range], STAGGER_SCALES[:, in_range], STAGGER_X_OFFSETS[in_range], STAGGER_ROT_Z[in_range])
+    for adjusted_times in (STAGGER_TIMES + 0.2 * i for i in range(STAGGER_COPIES))
+    for in_range in (adjusted_times <= 1.0,)
+)
+
+# Preset enum items, with the identifier order used by the previous/next buttons
+PRESET_ITEMS = [
+    ('PRESET_A', 'Popup Scale', 'Simple pop-up with scale animation'),
+    ('PRESET_B', 'Fade In Slide', 'Fade in with slight movement'),
+    ('PRESET_C', 'Bouncy Reveal', 'Quick reveal with bouncy scale'),
+    ('PRESET_ROTATE_POP', 'Pop-Up + Rotate', 'Pop-up with rotation'),
+    ('PRESET_BOUNCE_IN', 'Bounce In', 'Bouncy entrance animation'),
+    ('PRESET_SLIDE_FROM_SIDE', 'Slide In', 'Slide in from the side'),
+    ('PRESET_FALL_FROM_SKY', 'Fall In', 'Fall from above with bounce'),
+    ('PRESET_FLIP_REVEAL', 'Flip Reveal', '3D flip reveal animation'),
+    ('PRESET_TYPEWRITER', 'Typewriter', 'Sequential appearance animation'),
+    ('PRESET_PULSE', 'Pulse', 'Pulsing scale animation'),
+    ('PRESET_ELASTIC', 'Elastic', 'Elastic stretch and squash'),
+    ('PRESET_STAGGER', 'Staggered', 'Sequential staggered reveal')
+]
+PRESET_IDS = tuple(identifier for identifier, name, description in PRESET_ITEMS)
+PRESET_INDEX = {identifier: i for i, identifier in enumerate(PRESET_IDS)}
+# Preview video name of each preset, its identifier without the PRESET_ prefix
+PRESET_PREVIEW_NAMES = {identifier: identifier.removeprefix('PRESET_') for identifier in PRESET_IDS}
 
 class ANIM_PG_AnimationPresetProperties(PropertyGroup):
     is_playing: BoolProperty(name="Is Playing", default=False) # type: ignore
     
     def update_start_frame(self, context):
-        # Only update if values actually changed
-        if (context.scene.frame_current != self.start_frame or 
-            context.scene.frame_start != self.start_frame):
-            context.scene.frame_current = self.start_frame
-            context.scene.frame_start = self.start_frame
+        # Only write the values that actually changed
+        scene = context.scene
+        start_frame = self.start_frame
+        if scene.frame_current != start_frame:
+            scene.frame_current = start_frame
+        if scene.frame_start != start_frame:
+            scene.frame_start = start_frame
     
     # Remove update_speed logic that changes FPS
     start_frame: IntProperty(
@@ -57,35 +245,138 @@ class ANIM_PG_AnimationPresetProperties(PropertyGroup):
 
     preset_enum: EnumProperty(
         name="Preset",
-        items=[
-            ('PRESET_A', 'Popup Scale', 'Simple pop-up with scale animation'),
-            ('PRESET_B', 'Fade In Slide', 'Fade in with slight movement'),
-            ('PRESET_C', 'Bouncy Reveal', 'Quick reveal with bouncy scale'),
-            ('PRESET_ROTATE_POP', 'Pop-Up + Rotate', 'Pop-up with rotation'),
-            ('PRESET_BOUNCE_IN', 'Bounce In', 'Bouncy entrance animation'),
-            ('PRESET_SLIDE_FROM_SIDE', 'Slide In', 'Slide in from the side'),
-            ('PRESET_FALL_FROM_SKY', 'Fall In', 'Fall from above with bounce'),
-            ('PRESET_FLIP_REVEAL', 'Flip Reveal', '3D flip reveal animation'),
-            ('PRESET_TYPEWRITER', 'Typewriter', 'Sequential appearance animation'),
-            ('PRESET_PULSE', 'Pulse', 'Pulsing scale animation'),
-            ('PRESET_ELASTIC', 'Elastic', 'Elastic stretch and squash'),
-            ('PRESET_STAGGER', 'Staggered', 'Sequential staggered reveal')
-        ],
+        items=PRESET_ITEMS,
         default='PRESET_ROTATE_POP'
     ) # type: ignore
 
-    def get_preview_path(self, preset_name):
-        addon_dir = os.path.dirname(__file__)
-        preview_dir = os.path.join(addon_dir, "previews")
-        optimized_dir = os.path.join(preview_dir, "optimized")
-        
-        # First try to get optimized version
-        optimized_path = os.path.join(optimized_dir, f"{preset_name}.mov")
-        if os.path.exists(optimized_path):
-            return optimized_path
-            
-        # Fall back to original if optimized doesn't exist
-        return os.path.join(preview_dir, f"{preset_name}.mov")
+def cull_flat_scale_keys(context):
+    """
+    Whether the identity scale keys of pulse/bounce in can be left out. The interpolation is
+    replaced by the chosen easing afterwards, and ELASTIC still moves between equal values.
+    """
+    return context.scene.animation_preset_props.animation_easing != 'ELASTIC'
+
+# Preview video locations, resolved once
+addon_dir = os.path.dirname(__file__)
+preview_dir = os.path.join(addon_dir, "previews")
+optimized_dir = os.path.join(preview_dir, "optimized")
+
+@functools.lru_cache(maxsize=64)
+def get_preview_path(preset_name):
+    """
+    Resolve the preview video of a preset. Results are cached, so the cache is cleared whenever
+    optimized previews may have been written (ANIM_OT_OptimizePreviews) and on unregister.
+    """
+    # First try to get optimized version
+    optimized_path = os.path.join(optimized_dir, f"{preset_name}.mov")
+    if os.path.exists(optimized_path):
+        return optimized_path
+        
+    # Fall back to original if optimized doesn't exist
+    return os.path.join(preview_dir, f"{preset_name}.mov")
+
+def make_animation_copy(obj, name):
+    """
+    Create a temporary stand-in of a mesh object whose transform gets animated. A bare object
+    on the same mesh is enough unless modifiers, constraints, object-linked materials or a parent
+    have to carry over, in which case the full Object.copy() is used.
+    """
+    if (obj.parent or obj.modifiers or obj.constraints
+            or any(slot.link == 'OBJECT' for slot in obj.material_slots)):
+        return obj.copy()
+    
+    # The presets key the local transform, so copy it channel by channel along with the
+    # delta transforms rather than baking everything into the world matrix
+    copy = bpy.data.objects.new(name, obj.data)
+    copy.rotation_mode = obj.rotation_mode
+    copy.location = obj.location
+    copy.rotation_euler = obj.rotation_euler
+    copy.rotation_quaternion = obj.rotation_quaternion
+    copy.rotation_axis_angle = obj.rotation_axis_angle
+    copy.scale = obj.scale
+    copy.delta_location = obj.delta_location
+    copy.delta_rotation_euler = obj.delta_rotation_euler
+    copy.delta_rotation_quaternion = obj.delta_rotation_quaternion
+    copy.delta_scale = obj.delta_scale
+    return copy
+
+# Temporary copies made by the presets and the objects they hid, removed together
+# by a single timer once the last applied animation has played
+pending_copies = []
+pending_hidden_objects = []
+
+def id_is_alive(id_data):
+    """False once the ID has been removed, e.g. deleted by the user while the animation played"""
+    try:
+        id_data.name
+    except ReferenceError:
+        return False
+    return True
+
+def cleanup_pending_copies():
+    # The lists are shared by every apply, so they are emptied even if something fails
+    try:
+        for hidden_obj, original_hide in pending_hidden_objects:
+            if id_is_alive(hidden_obj):
+                hidden_obj.hide_viewport = original_hide
+        bpy.data.batch_remove(ids=[copy for copy in pending_copies if copy and id_is_alive(copy)])
+    finally:
+        pending_copies.clear()
+        pending_hidden_objects.clear()
+    return None
+
+def schedule_copy_cleanup(delay):
+    """(Re)start the single cleanup timer so it fires after the latest animation"""
+    if bpy.app.timers.is_registered(cleanup_pending_copies):
+        bpy.app.timers.unregister(cleanup_pending_copies)
+    bpy.app.timers.register(cleanup_pending_copies, first_interval=delay)
+
+# Deferred cleanup callbacks as (deadline, callback), drained by a single timer
+pending_cleanups = []
+
+def drain_pending_cleanups():
+    now = time.monotonic()
+    due = [callback for deadline, callback in pending_cleanups if deadline <= now]
+    pending_cleanups[:] = [entry for entry in pending_cleanups if entry[0] > now]
+    for callback in due:
+        try:
+            callback()
+        except Exception as e:
+            print(f"Cleanup failed: {e}")
+    
+    # Sleep until the next deadline, unregister once nothing is left
+    if pending_cleanups:
+        return max(0.0, min(deadline for deadline, callback in pending_cleanups) - now)
+    return None
+
+def schedule_cleanup(delay, callback):
+    """Run callback after delay seconds through the shared cleanup timer"""
+    pending_cleanups.append((time.monotonic() + delay, callback))
+    if bpy.app.timers.is_registered(drain_pending_cleanups):
+        bpy.app.timers.unregister(drain_pending_cleanups)
+    now = time.monotonic()
+    bpy.app.timers.register(drain_pending_cleanups, first_interval=max(0.0, min(deadline for deadline, callback in pending_cleanups) - now))
+
+# Play/pause button icon for each playback state
+PLAYBACK_ICONS = {True: 'PAUSE', False: 'PLAY'}
+
+@bpy.app.handlers.persistent
+def on_playback_start(scene, depsgraph=None):
+    scene.animation_preset_props.is_playing = True
+
+@bpy.app.handlers.persistent
+def on_playback_stop(scene, depsgraph=None):
+    scene.animation_preset_props.is_playing = False
+
+# Playback handlers keeping is_playing in sync, only available in newer Blender versions
+playback_handlers = tuple(
+    (handlers, callback)
+    for handlers, callback in (
+        (getattr(bpy.app.handlers, 'animation_playback_pre', None), on_playback_start),
+        (getattr(bpy.app.handlers, 'animation_playback_post', None), on_playback_stop),
+    )
+    if handlers is not None
+)
 
 # Function to update playback state
 def update_playback_state(self, context):
@@ -98,8 +389,7 @@ def update_playback_state(self, context):
 def update_easing(self, context):
     # Update easing for selected objects
     for obj in context.selected_objects:
-        if obj.animation_data and obj.animation_data.action:
-            utils.set_interpolation(obj, self.animation_easing)
+        utils.set_interpolation(obj, self.animation_easing)
 
 # Operators
 class ANIM_OT_play_animation(Operator):
@@ -108,8 +398,8 @@ class ANIM_OT_play_animation(Operator):
     
     @classmethod
     def poll(cls, context):
-        # Only enable if objects are selected
-        return bool(context.selected_objects)
+        # Only enable if any object is selected, without building the whole selection list
+        return next(iter(context.view_layer.objects.selected), None) is not None
 
     def execute(self, context):
         props = context.scene.animation_preset_props
@@ -130,8 +420,8 @@ class ANIM_OT_reset_animation(Operator):
     
     @classmethod
     def poll(cls, context):
-        # Only enable if objects are selected
-        return bool(context.selected_objects)
+        # Only enable if any object is selected, without building the whole selection list
+        return next(iter(context.view_layer.objects.selected), None) is not None
 
     def execute(self, context):
         # Set current frame to start frame
@@ -141,6 +431,8 @@ class ANIM_OT_reset_animation(Operator):
         # Clear animation data for selected objects
         for obj in context.selected_objects:
             utils.clear_keyframes(obj)
+            if "_anim_preset_sig" in obj:
+                del obj["_anim_preset_sig"]
             
         self.report({'INFO'}, "Animation Reset")
         return {'FINISHED'}
@@ -151,595 +443,287 @@ class ANIM_OT_add_preset(Operator):
     
     @classmethod
     def poll(cls, context):
-        return bool(context.selected_objects)
+        return next(iter(context.view_layer.objects.selected), None) is not None
 
     def execute(self, context):
-        props = context.scene.animation_preset_props
-        preset = props.preset_enum
-        speed = props.animation_speed
-        
-        # Base duration in frames (will be scaled by speed)
-        base_duration = 30
-        start_frame = context.scene.frame_current
-        
-        # Calculate actual duration based on speed
-        # Faster speed = shorter duration
-        actual_duration = int(base_duration / speed)
-        end_frame = start_frame + actual_duration
-        
-        # Apply the selected preset to all selected objects
-        for obj in context.selected_objects:
-            # Clear existing animation
-            utils.clear_keyframes(obj)
-            
-            # Apply different animation based on selected preset
-            if preset == 'PRESET_A':
-                self.apply_popup_scale(obj, start_frame, end_frame)
-            elif preset == 'PRESET_B':
-                self.apply_fade_slide(obj, start_frame, end_frame)
-            elif preset == 'PRESET_C':
-                self.apply_bouncy_reveal(obj, start_frame, end_frame)
-            elif preset == 'PRESET_ROTATE_POP':
-                self.apply_rotate_pop(obj, start_frame, end_frame)
-            elif preset == 'PRESET_BOUNCE_IN':
-                self.apply_bounce_in(obj, start_frame, end_frame)
-            elif preset == 'PRESET_SLIDE_FROM_SIDE':
-                self.apply_slide_from_side(obj, start_frame, end_frame)
-            elif preset == 'PRESET_FALL_FROM_SKY':
-                self.apply_fall_from_sky(obj, start_frame, end_frame)
-            elif preset == 'PRESET_FLIP_REVEAL':
-                self.apply_flip_reveal(obj, start_frame, end_frame)
-            elif preset == 'PRESET_TYPEWRITER':
-                self.apply_typewriter(context, obj, start_frame, end_frame)
-            elif preset == 'PRESET_PULSE':
-                self.apply_pulse(obj, start_frame, end_frame)
-            elif preset == 'PRESET_ELASTIC':
-                self.apply_elastic(obj, start_frame, end_frame)
-            elif preset == 'PRESET_STAGGER':
-                self.apply_stagger(context, obj, start_frame, end_frame)
-            
-            # Set interpolation
-            utils.set_interpolation(obj, props.animation_easing)
-        
+        apply_preset_to_selection(self, context)
         return {'FINISHED'}
     
-    def apply_popup_scale(self, obj, start_frame, end_frame):
+    def apply_popup_scale(self, context, obj, start_frame, end_frame):
         # Define keyframe timing relative to animation duration
         duration = end_frame - start_frame
+        frames = start_frame + (duration * POPUP_SCALE_TIMES).astype(np.int32)
         
-        # Calculate intermediate frames
-        frame1 = start_frame
-        frame2 = start_frame + int(duration * 0.4)  # Overshoot at 40%
-        frame3 = start_frame + int(duration * 0.7)  # Undershoot at 70%
-        frame4 = end_frame                          # Final position
-        
-        # Insert keyframes with easing
-        utils.insert_keyframe(obj, "scale", frame1, (0, 0, 0))
-        utils.insert_keyframe(obj, "scale", frame2, (1.2, 1.2, 1.2))
-        utils.insert_keyframe(obj, "scale", frame3, (0.9, 0.9, 0.9))
-        utils.insert_keyframe(obj, "scale", frame4, (1, 1, 1))
-        
-        # Set interpolation for smooth animation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = 'SINE'
-                    keyframe.easing = 'EASE_IN_OUT'
-    
-    def apply_fade_slide(self, obj, start_frame, end_frame):
-        final_pos = obj.location.copy()
+        # Insert keyframes with easing for smooth animation
+        utils.bulk_insert_keyframes(obj, "scale", frames, POPUP_SCALE_SCALES, 'SINE', 'EASE_IN_OUT')
+    
+    def apply_fade_slide(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
+        frames = start_frame + (duration * FADE_SLIDE_TIMES).astype(np.int32)
         
-        # Define keyframes with relative timing for position, scale, and opacity
-        keyframes = [
-            (0.0, -2.0, 0.0, (0.9, 0.9, 0.9)),    # Start: offset left, invisible, slightly scaled down
-            (0.3, -1.0, 0.4, (0.95, 0.95, 0.95)), # Starting to appear
-            (0.7, -0.2, 0.8, (1.1, 1.1, 1.1)),    # Almost there, slight overshoot
-            (1.0, 0.0, 1.0, (1.0, 1.0, 1.0))      # Final position
+        # Position keyframes, offset horizontally from the final position
+        positions = offset_keyframe_values(obj.location, 0, FADE_SLIDE_X_OFFSETS)
+        
+        # Collect the principled BSDF alpha inputs once, not per keyframe
+        alpha_inputs = [
+            node.inputs['Alpha']
+            for slot in obj.material_slots if slot.material and slot.material.use_nodes
+            for node in slot.material.node_tree.nodes if node.type == 'BSDF_PRINCIPLED'
         ]
         
-        # Apply keyframes with relative timing
-        for time_pct, x_offset, alpha, scale in keyframes:
-            frame = start_frame + int(duration * time_pct)
-            
-            # Position keyframe
-            pos = (final_pos.x + x_offset, final_pos.y, final_pos.z)
-            utils.insert_keyframe(obj, "location", frame, pos)
-            
-            # Scale keyframe for subtle pop
-            utils.insert_keyframe(obj, "scale", frame, scale)
-            
-            # Fade keyframe
-            if obj.material_slots:
-                for slot in obj.material_slots:
-                    if slot.material and slot.material.use_nodes:
-                        for node in slot.material.node_tree.nodes:
-                            if node.type == 'BSDF_PRINCIPLED':
-                                node.inputs['Alpha'].default_value = alpha
-                                node.inputs['Alpha'].keyframe_insert('default_value', frame=frame)
+        # Fade keyframes
+        if alpha_inputs:
+            for frame, alpha in zip(frames.tolist(), FADE_SLIDE_ALPHAS.tolist()):
+                for alpha_input in alpha_inputs:
+                    alpha_input.default_value = alpha
+                    alpha_input.keyframe_insert('default_value', frame=frame)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "location":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_OUT'
-                elif fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-                
-                # Set material alpha interpolation if it exists
-                elif "Alpha" in fcurve.data_path:
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN'
-    
-    def apply_bouncy_reveal(self, obj, start_frame, end_frame):
+        # Insert keyframes with interpolation, scale adds a subtle pop
+        action = utils.bulk_insert_keyframes(obj, "location", frames, positions, 'SINE', 'EASE_OUT')
+        utils.bulk_insert_keyframes(obj, "scale", frames, FADE_SLIDE_SCALES, 'SINE', 'EASE_IN_OUT', action=action)
+    
+    def apply_bouncy_reveal(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
+        frames = start_frame + (duration * BOUNCY_REVEAL_TIMES).astype(np.int32)
         
-        # Define keyframes with relative timing for scale and rotation
-        keyframes = [
-            (0.0, (0.0, 0.0, 0.0), (0, 0, 0)),         # Start: invisible
-            (0.3, (1.3, 1.3, 1.3), (0, 0, 15)),        # First overshoot with slight rotation
-            (0.5, (0.7, 0.7, 0.7), (0, 0, -10)),       # First undershoot with counter-rotation
-            (0.7, (1.1, 1.1, 1.1), (0, 0, 5)),         # Second overshoot
-            (0.85, (0.9, 0.9, 0.9), (0, 0, -2)),       # Second undershoot
-            (1.0, (1.0, 1.0, 1.0), (0, 0, 0))          # Final position
-        ]
-        
-        # Store original rotation
-        orig_rot = obj.rotation_euler.copy()
-        
-        # Apply keyframes with relative timing
-        for time_pct, scale, rot_offset in keyframes:
-            frame = start_frame + int(duration * time_pct)
-            
-            # Scale keyframe
-            utils.insert_keyframe(obj, "scale", frame, scale)
-            
-            # Rotation keyframe (add offset to original rotation)
-            rot = (
-                orig_rot[0],
-                orig_rot[1],
-                orig_rot[2] + math.radians(rot_offset[2])
-            )
-            utils.insert_keyframe(obj, "rotation_euler", frame, rot)
+        # Rotation keyframes (add offset to original rotation)
+        rotations = offset_keyframe_values(obj.rotation_euler, 2, BOUNCY_REVEAL_ROT_OFFSETS)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'ELASTIC'
-                        keyframe.easing = 'EASE_OUT'
-                elif fcurve.data_path == "rotation_euler":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-    
-    def apply_rotate_pop(self, obj, start_frame, end_frame):
-        start_rot = obj.rotation_euler.copy()
+        # Insert keyframes with interpolation
+        action = utils.bulk_insert_keyframes(obj, "scale", frames, BOUNCY_REVEAL_SCALES, 'ELASTIC', 'EASE_OUT')
+        utils.bulk_insert_keyframes(obj, "rotation_euler", frames, rotations, 'SINE', 'EASE_IN_OUT', action=action)
+    
+    def apply_rotate_pop(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
+        frames = start_frame + (duration * ROTATE_POP_TIMES).astype(np.int32)
         
-        # Define keyframes with relative timing for both rotation and scale
-        keyframes = [
-            (0.0, 0, (0.0, 0.0, 0.0)),      # Start: invisible
-            (0.2, 90, (0.8, 0.8, 0.8)),     # Quarter turn, starting to appear
-            (0.5, 270, (1.2, 1.2, 1.2)),    # Three-quarter turn, overshoot scale
-            (0.7, 330, (0.9, 0.9, 0.9)),    # Nearly complete, slight undershoot
-            (1.0, 360, (1.0, 1.0, 1.0))     # Final position
-        ]
-        
-        # Apply keyframes with relative timing
-        for time_pct, angle, scale in keyframes:
-            frame = start_frame + int(duration * time_pct)
-            # Rotation keyframe
-            rot = (
-                start_rot[0],
-                start_rot[1],
-                start_rot[2] + math.radians(angle)
-            )
-            utils.insert_keyframe(obj, "rotation_euler", frame, rot)
-            # Scale keyframe
-            utils.insert_keyframe(obj, "scale", frame, scale)
+        # Rotation keyframes (turn around Z from the start rotation)
+        rotations = offset_keyframe_values(obj.rotation_euler, 2, ROTATE_POP_ANGLES)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "rotation_euler":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-                elif fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'BACK'
-                        keyframe.easing = 'EASE_OUT'
-    
-    def apply_bounce_in(self, obj, start_frame, end_frame):
-        orig_loc = obj.location.copy()
+        # Insert keyframes with interpolation
+        action = utils.bulk_insert_keyframes(obj, "rotation_euler", frames, rotations, 'SINE', 'EASE_IN_OUT')
+        utils.bulk_insert_keyframes(obj, "scale", frames, ROTATE_POP_SCALES, 'BACK', 'EASE_OUT', action=action)
+    
+    def apply_bounce_in(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
+        frames = start_frame + (duration * BOUNCE_IN_TIMES).astype(np.int32)
         
-        # Define bounce heights and relative timings
-        bounce_keyframes = [
-            (0.0, -5.0, (0.9, 0.9, 1.3)),    # Start: stretched
-            (0.3, 0.0, (1.2, 1.2, 0.8)),     # First impact: squashed
-            (0.5, 2.0, (0.9, 0.9, 1.2)),     # First bounce peak: stretched
-            (0.7, 0.0, (1.1, 1.1, 0.9)),     # Second impact: less squashed
-            (0.85, 0.8, (0.95, 0.95, 1.1)),  # Small bounce
-            (1.0, 0.0, (1.0, 1.0, 1.0))      # Final rest position
-        ]
-        
-        # Apply keyframes with relative timing
-        for time_pct, height, scale in bounce_keyframes:
-            frame = start_frame + int(duration * time_pct)
-            # Position keyframe
-            pos = (orig_loc.x, orig_loc.y, orig_loc.z + height)
-            utils.insert_keyframe(obj, "location", frame, pos)
-            # Scale keyframe for squash and stretch
-            utils.insert_keyframe(obj, "scale", frame, scale)
+        # Position keyframes (bounce heights above the original location)
+        positions = offset_keyframe_values(obj.location, 2, BOUNCE_IN_HEIGHTS)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "location":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'BOUNCE'
-                        keyframe.easing = 'EASE_OUT'
-                elif fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-    
-    def apply_slide_from_side(self, obj, start_frame, end_frame):
+        # Insert keyframes with interpolation, scale adds squash and stretch
+        action = utils.bulk_insert_keyframes(obj, "location", frames, positions, 'BOUNCE', 'EASE_OUT')
+        utils.bulk_insert_keyframes(obj, "scale", frames, BOUNCE_IN_SCALES, 'SINE', 'EASE_IN_OUT', action=action,
+                                    cull_flat=cull_flat_scale_keys(context))
+    
+    def apply_slide_from_side(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
-        final_pos = obj.location.copy()
-        start_rot = obj.rotation_euler.copy()
-        
-        # Define keyframes with relative timing for position, rotation, and scale
-        keyframes = [
-            (0.0, -3.0, -15, (0.8, 0.8, 0.8)),     # Start: offset left, tilted, small
-            (0.3, -2.0, -10, (0.9, 0.9, 1.1)),     # Moving right, starting to straighten
-            (0.6, -0.5, -5, (1.1, 1.1, 0.9)),      # Almost there, slight tilt
-            (0.8, 0.2, 2, (1.05, 1.05, 1.05)),     # Overshoot position
-            (0.9, 0.1, 1, (0.95, 0.95, 0.95)),     # Settling back
-            (1.0, 0.0, 0, (1.0, 1.0, 1.0))         # Final position
-        ]
+        frames = start_frame + (duration * SLIDE_FROM_SIDE_TIMES).astype(np.int32)
         
-        # Apply keyframes with relative timing
-        for time_pct, x_offset, rot_z, scale in keyframes:
-            frame = start_frame + int(duration * time_pct)
-            
-            # Position keyframe
-            pos = (final_pos.x + x_offset, final_pos.y, final_pos.z)
-            utils.insert_keyframe(obj, "location", frame, pos)
-            
-            # Rotation keyframe
-            rot = (
-                start_rot[0],
-                start_rot[1],
-                start_rot[2] + math.radians(rot_z)
-            )
-            utils.insert_keyframe(obj, "rotation_euler", frame, rot)
-            
-            # Scale keyframe for subtle squash and stretch
-            utils.insert_keyframe(obj, "scale", frame, scale)
+        # Position keyframes, offset horizontally from the final position
+        positions = offset_keyframe_values(obj.location, 0, SLIDE_FROM_SIDE_X_OFFSETS)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "location":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'BACK'
-                        keyframe.easing = 'EASE_OUT'
-                elif fcurve.data_path == "rotation_euler":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-                elif fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-    
-    def apply_fall_from_sky(self, obj, start_frame, end_frame):
-        final_pos = obj.location.copy()
+        # Rotation keyframes (tilt around Z from the start rotation)
+        rotations = offset_keyframe_values(obj.rotation_euler, 2, SLIDE_FROM_SIDE_ROT_OFFSETS)
+        
+        # Insert keyframes with interpolation, scale adds subtle squash and stretch
+        action = utils.bulk_insert_keyframes(obj, "location", frames, positions, 'BACK', 'EASE_OUT')
+        utils.bulk_insert_keyframes(obj, "rotation_euler", frames, rotations, 'SINE', 'EASE_IN_OUT', action=action)
+        utils.bulk_insert_keyframes(obj, "scale", frames, SLIDE_FROM_SIDE_SCALES, 'SINE', 'EASE_IN_OUT', action=action)
+    
+    def apply_fall_from_sky(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
+        frames = start_frame + (duration * FALL_FROM_SKY_TIMES).astype(np.int32)
         
-        # Define fall and bounce keyframes with relative timing
-        fall_keyframes = [
-            (0.0, 10.0, (0.8, 0.8, 1.4)),     # Start high up, stretched
-            (0.3, -0.2, (1.4, 1.4, 0.6)),     # First impact, heavily squashed
-            (0.5, 2.0, (0.9, 0.9, 1.2)),      # First bounce peak
-            (0.7, -0.1, (1.2, 1.2, 0.8)),     # Second impact
-            (0.85, 0.5, (0.95, 0.95, 1.1)),   # Small bounce
-            (0.92, 0.0, (1.1, 1.1, 0.9)),     # Final small impact
-            (1.0, 0.0, (1.0, 1.0, 1.0))       # Rest position
-        ]
+        # Position keyframes (fall and bounce heights above the final position)
+        positions = offset_keyframe_values(obj.location, 2, FALL_FROM_SKY_HEIGHTS)
         
-        # Apply keyframes with relative timing
-        for time_pct, height, scale in fall_keyframes:
-            frame = start_frame + int(duration * time_pct)
-            # Position keyframe
-            pos = (final_pos.x, final_pos.y, final_pos.z + height)
-            utils.insert_keyframe(obj, "location", frame, pos)
-            # Scale keyframe for squash and stretch
-            utils.insert_keyframe(obj, "scale", frame, scale)
+        # Fast fall with ease in, then a bouncy landing
+        falling = frames < start_frame + (duration * 0.3)
+        interpolation = np.where(falling, utils.interpolation_values['SINE'], utils.interpolation_values['BOUNCE']).astype(np.int32)
+        easing = np.where(falling, utils.easing_values['EASE_IN'], utils.easing_values['EASE_OUT']).astype(np.int32)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "location":
-                    for keyframe in fcurve.keyframe_points:
-                        if keyframe.co[0] < start_frame + (duration * 0.3):
-                            # Fast fall with ease in
-                            keyframe.interpolation = 'SINE'
-                            keyframe.easing = 'EASE_IN'
-                        else:
-                            # Bouncy landing
-                            keyframe.interpolation = 'BOUNCE'
-                            keyframe.easing = 'EASE_OUT'
-                elif fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-    
-    def apply_flip_reveal(self, obj, start_frame, end_frame):
+        # Insert keyframes with interpolation
+        action = utils.bulk_insert_keyframes(obj, "location", frames, positions, interpolation, easing)
+        utils.bulk_insert_keyframes(obj, "scale", frames, FALL_FROM_SKY_SCALES, 'SINE', 'EASE_IN_OUT', action=action)
+    
+    def apply_flip_reveal(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
-        start_rot = obj.rotation_euler.copy()
-        
-        # Define keyframes with relative timing for rotation, scale, and position
-        keyframes = [
-            (0.0, 0, (0.0, 0.0, 0.0), 0.0),      # Start: invisible
-            (0.2, 45, (0.6, 0.6, 0.6), 0.2),     # Starting to appear and flip
-            (0.5, 135, (1.2, 1.2, 1.2), -0.1),   # Mid-flip, overshoot scale
-            (0.7, 160, (0.9, 0.9, 0.9), 0.05),   # Nearly complete
-            (0.85, 175, (1.1, 1.1, 1.1), -0.02), # Final approach
-            (1.0, 180, (1.0, 1.0, 1.0), 0.0)     # Final position
-        ]
+        frames = start_frame + (duration * FLIP_REVEAL_TIMES).astype(np.int32)
         
-        # Store original position
-        orig_pos = obj.location.copy()
+        # Rotation keyframes (flip around X axis)
+        rotations = offset_keyframe_values(obj.rotation_euler, 0, FLIP_REVEAL_ANGLES)
         
-        # Apply keyframes with relative timing
-        for time_pct, angle, scale, y_offset in keyframes:
-            frame = start_frame + int(duration * time_pct)
-            
-            # Rotation keyframe (flip around X axis)
-            rot = (
-                start_rot[0] + math.radians(angle),
-                start_rot[1],
-                start_rot[2]
-            )
-            utils.insert_keyframe(obj, "rotation_euler", frame, rot)
-            
-            # Scale keyframe
-            utils.insert_keyframe(obj, "scale", frame, scale)
-            
-            # Position keyframe (slight Y movement for depth)
-            pos = (orig_pos.x, orig_pos.y + y_offset, orig_pos.z)
-            utils.insert_keyframe(obj, "location", frame, pos)
+        # Position keyframes (slight Y movement for depth)
+        positions = offset_keyframe_values(obj.location, 1, FLIP_REVEAL_Y_OFFSETS)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "rotation_euler":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-                elif fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_OUT'
-                elif fcurve.data_path == "location":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
+        # Insert keyframes with interpolation
+        action = utils.bulk_insert_keyframes(obj, "rotation_euler", frames, rotations, 'SINE', 'EASE_IN_OUT')
+        utils.bulk_insert_keyframes(obj, "scale", frames, FLIP_REVEAL_SCALES, 'SINE', 'EASE_OUT', action=action)
+        utils.bulk_insert_keyframes(obj, "location", frames, positions, 'SINE', 'EASE_IN_OUT', action=action)
     
     def apply_typewriter(self, context, obj, start_frame, end_frame):
         if obj.type == 'MESH':
             duration = end_frame - start_frame
             
             # Store original state
-            original_hide = obj.hide_viewport
-            original_loc = obj.location.copy()
+            self.hidden_objects.append((obj, obj.hide_viewport))
             obj.hide_viewport = True
             
-            # Create copy for animation
+            # Create copy for animation, it shares the mesh since only its transform is animated
             copy = obj.copy()
-            copy.data = obj.data.copy()
             context.scene.collection.objects.link(copy)
+            self.temp_copies.append(copy)
             
-            # Define keyframes with relative timing
-            keyframes = [
-                (0.0, (0.0, 0.0, 0.0), -0.5, 10),    # Start: invisible, offset left, rotated
-                (0.2, (0.7, 0.7, 0.7), -0.3, 5),     # Appearing, moving right
-                (0.5, (1.1, 1.1, 1.1), -0.1, -3),    # Overshoot
-                (0.7, (0.9, 0.9, 0.9), 0.0, 2),      # Settling
-                (1.0, (1.0, 1.0, 1.0), 0.0, 0)       # Final position
-            ]
-            
-            # Apply keyframes with relative timing
-            for time_pct, scale, x_offset, rot_z in keyframes:
-                frame = start_frame + int(duration * time_pct)
-                
-                # Scale keyframe
-                utils.insert_keyframe(copy, "scale", frame, scale)
-                
-                # Position keyframe
-                pos = (original_loc.x + x_offset, original_loc.y, original_loc.z)
-                utils.insert_keyframe(copy, "location", frame, pos)
-                
-                # Rotation keyframe
-                rot = copy.rotation_euler.copy()
-                rot.z = math.radians(rot_z)
-                utils.insert_keyframe(copy, "rotation_euler", frame, rot)
+            frames = start_frame + (duration * TYPEWRITER_TIMES).astype(np.int32)
             
-            # Set interpolation
-            if copy.animation_data and copy.animation_data.action:
-                for fcurve in copy.animation_data.action.fcurves:
-                    if fcurve.data_path == "scale":
-                        for keyframe in fcurve.keyframe_points:
-                            keyframe.interpolation = 'SINE'
-                            keyframe.easing = 'EASE_OUT'
-                    elif fcurve.data_path == "location":
-                        for keyframe in fcurve.keyframe_points:
-                            keyframe.interpolation = 'BACK'
-                            keyframe.easing = 'EASE_OUT'
-                    elif fcurve.data_path == "rotation_euler":
-                        for keyframe in fcurve.keyframe_points:
-                            keyframe.interpolation = 'SINE'
-                            keyframe.easing = 'EASE_IN_OUT'
+            # Position keyframes, offset horizontally from the original location
+            positions = offset_keyframe_values(obj.location, 0, TYPEWRITER_X_OFFSETS)
             
-            # Schedule cleanup
-            def cleanup():
-                obj.hide_viewport = original_hide
-                if copy:
-                    bpy.data.objects.remove(copy, do_unlink=True)
-                return None
+            # Rotation keyframes
+            rotations = replace_keyframe_values(copy.rotation_euler, 2, TYPEWRITER_ROT_Z)
             
-            bpy.app.timers.register(cleanup, first_interval=max(0.1, duration / context.scene.render.fps))
+            # Insert keyframes with interpolation
+            action = utils.bulk_insert_keyframes(copy, "scale", frames, TYPEWRITER_SCALES, 'SINE', 'EASE_OUT')
+            utils.bulk_insert_keyframes(copy, "location", frames, positions, 'BACK', 'EASE_OUT', action=action)
+            utils.bulk_insert_keyframes(copy, "rotation_euler", frames, rotations, 'SINE', 'EASE_IN_OUT', action=action)
     
-    def apply_pulse(self, obj, start_frame, end_frame):
+    def apply_pulse(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
+        frames = start_frame + (duration * PULSE_TIMES).astype(np.int32)
         
-        # Define keyframes with relative timing for scale and subtle rotation
-        keyframes = [
-            (0.0, (1.0, 1.0, 1.0), (0, 0, 0)),       # Start: normal size
-            (0.2, (1.3, 1.3, 0.8), (0, 0, 2)),       # Quick expand horizontally, compress vertically
-            (0.4, (0.8, 0.8, 1.3), (0, 0, -2)),      # Contract horizontally, expand vertically
-            (0.6, (1.2, 1.2, 0.9), (0, 0, 1)),       # Second pulse, smaller
-            (0.8, (0.9, 0.9, 1.1), (0, 0, -1)),      # Final contraction
-            (1.0, (1.0, 1.0, 1.0), (0, 0, 0))        # Return to normal
-        ]
-        
-        # Store original rotation
-        orig_rot = obj.rotation_euler.copy()
-        
-        # Apply keyframes with relative timing
-        for time_pct, scale, rot_offset in keyframes:
-            frame = start_frame + int(duration * time_pct)
-            
-            # Scale keyframe
-            utils.insert_keyframe(obj, "scale", frame, scale)
-            
-            # Rotation keyframe (add offset to original rotation)
-            rot = (
-                orig_rot[0],
-                orig_rot[1],
-                orig_rot[2] + math.radians(rot_offset[2])
-            )
-            utils.insert_keyframe(obj, "rotation_euler", frame, rot)
+        # Rotation keyframes (add offset to original rotation)
+        rotations = offset_keyframe_values(obj.rotation_euler, 2, PULSE_ROT_OFFSETS)
         
-        # Set interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path == "scale":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-                elif fcurve.data_path == "rotation_euler":
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = 'SINE'
-                        keyframe.easing = 'EASE_IN_OUT'
-    
-    def apply_elastic(self, obj, start_frame, end_frame):
+        # Insert keyframes with interpolation
+        action = utils.bulk_insert_keyframes(obj, "scale", frames, PULSE_SCALES, 'SINE', 'EASE_IN_OUT',
+                                             cull_flat=cull_flat_scale_keys(context))
+        utils.bulk_insert_keyframes(obj, "rotation_euler", frames, rotations, 'SINE', 'EASE_IN_OUT', action=action)
+    
+    def apply_elastic(self, context, obj, start_frame, end_frame):
         duration = end_frame - start_frame
+        frames = start_frame + (duration * ELASTIC_TIMES).astype(np.int32)
         
-        # Define elastic animation with relative timings and overshoot values
-        timings = [
-            (0.0, (0.0, 0.0, 0.0)),     # Start
-            (0.2, (1.5, 1.5, 1.5)),     # First overshoot
-            (0.4, (0.7, 0.7, 0.7)),     # First undershoot
-            (0.6, (1.2, 1.2, 1.2)),     # Second overshoot
-            (0.8, (0.9, 0.9, 0.9)),     # Second undershoot
-            (0.9, (1.05, 1.05, 1.05)),  # Final small overshoot
-            (1.0, (1.0, 1.0, 1.0))      # Settle
-        ]
-        
-        # Insert keyframes with relative timing
-        for time_pct, scale in timings:
-            frame = start_frame + int(duration * time_pct)
-            utils.insert_keyframe(obj, "scale", frame, scale)
-        
-        # Set elastic interpolation
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                for keyframe in fcurve.keyframe_points:
-                    keyframe.interpolation = 'ELASTIC'
-                    keyframe.easing = 'EASE_OUT'
-                    # Adjust elastic parameters for smoother motion
-                    keyframe.handle_left_type = 'AUTO_CLAMPED'
-                    keyframe.handle_right_type = 'AUTO_CLAMPED'
+        # Insert keyframes with relative timing and elastic interpolation
+        # (batch-added keyframes already use AUTO_CLAMPED handles)
+        utils.bulk_insert_keyframes(obj, "scale", frames, ELASTIC_SCALES, 'ELASTIC', 'EASE_OUT')
     
     def apply_stagger(self, context, obj, start_frame, end_frame):
-        if obj.type == 'MESH':
-            duration = end_frame - start_frame
-            copies = []
+        # Nothing to stagger for non-mesh, hidden or zero-length animations
+        if obj.type != 'MESH' or obj.hide_viewport or end_frame <= start_frame:
+            return
+        
+        duration = end_frame - start_frame
+        
+        # Create and animate copies with staggered timing, sharing the mesh
+        for i, (times, scales, x_offsets, rot_z) in enumerate(STAGGER_SCHEDULES):
+            copy = make_animation_copy(obj, f"{obj.name}_stagger_{i}")
+            context.scene.collection.objects.link(copy)
+            self.temp_copies.append(copy)
             
-            # Define base keyframes for a single element
-            base_keyframes = [
-                (0.0, (0.0, 0.0, 0.0), -0.3, 10),    # Start: invisible, offset, rotated
-                (0.3, (1.2, 1.2, 0.8), -0.1, -5),    # Appear with overshoot
-                (0.5, (0.9, 0.9, 1.1), 0.0, 2),      # Undershoot
-                (0.7, (1.1, 1.1, 0.9), 0.0, -1),     # Second overshoot
-                (1.0, (1.0, 1.0, 1.0), 0.0, 0)       # Final state
-            ]
+            frames = start_frame + (duration * times).astype(np.int32)
             
-            # Create and animate copies with staggered timing
-            num_copies = 3
-            for i in range(num_copies):
-                copy = obj.copy()
-                copy.data = obj.data.copy()
-                context.scene.collection.objects.link(copy)
-                copies.append(copy)
-                
-                # Calculate delay for this copy
-                delay_pct = 0.2 * i  # 20% delay between each copy
-                
-                # Apply keyframes with staggered timing
-                for time_pct, scale, x_offset, rot_z in base_keyframes:
-                    # Adjust timing for this copy
-                    adjusted_time = time_pct + delay_pct
-                    if adjusted_time <= 1.0:  # Only add keyframe if within duration
-                        frame = start_frame + int(duration * adjusted_time)
-                        
-                        # Scale keyframe
-                        utils.insert_keyframe(copy, "scale", frame, scale)
-                        
-                        # Position keyframe (offset horizontally)
-                        pos = (obj.location.x + x_offset, obj.location.y, obj.location.z)
-                        utils.insert_keyframe(copy, "location", frame, pos)
-                        
-                        # Rotation keyframe
-                        rot = copy.rotation_euler.copy()
-                        rot.z = math.radians(rot_z)
-                        utils.insert_keyframe(copy, "rotation_euler", frame, rot)
-                
-                # Set interpolation for this copy
-                if copy.animation_data and copy.animation_data.action:
-                    for fcurve in copy.animation_data.action.fcurves:
-                        if fcurve.data_path == "scale":
-                            for keyframe in fcurve.keyframe_points:
-                                keyframe.interpolation = 'ELASTIC'
-                                keyframe.easing = 'EASE_OUT'
-                        elif fcurve.data_path == "location":
-                            for keyframe in fcurve.keyframe_points:
-                                keyframe.interpolation = 'SINE'
-                                keyframe.easing = 'EASE_OUT'
-                        elif fcurve.data_path == "rotation_euler":
-                            for keyframe in fcurve.keyframe_points:
-                                keyframe.interpolation = 'SINE'
-                                keyframe.easing = 'EASE_IN_OUT'
+            # Position keyframes (offset horizontally)
+            positions = offset_keyframe_values(obj.location, 0, x_offsets)
             
-            # Schedule cleanup
-            def cleanup_all():
-                for copy in copies:
-                    if copy:
-                        bpy.data.objects.remove(copy, do_unlink=True)
-                return None
+            # Rotation keyframes
+            rotations = replace_keyframe_values(copy.rotation_euler, 2, rot_z)
             
-            bpy.app.timers.register(cleanup_all, first_interval=max(0.1, duration / context.scene.render.fps))
+            # Insert keyframes with interpolation for this copy
+            action = utils.bulk_insert_keyframes(copy, "scale", frames, scales, 'ELASTIC', 'EASE_OUT')
+            utils.bulk_insert_keyframes(copy, "location", frames, positions, 'SINE', 'EASE_OUT', action=action)
+            utils.bulk_insert_keyframes(copy, "rotation_euler", frames, rotations, 'SINE', 'EASE_IN_OUT', action=action)
+    
+    # Presets that animate temporary copies instead of the selected objects
+    copy_presets = {'PRESET_TYPEWRITER', 'PRESET_STAGGER'}
+    
+    # Preset enum identifier -> apply method, all taking (self, context, obj, start_frame, end_frame)
+    preset_methods = {
+        'PRESET_A': apply_popup_scale,
+        'PRESET_B': apply_fade_slide,
+        'PRESET_C': apply_bouncy_reveal,
+        'PRESET_ROTATE_POP': apply_rotate_pop,
+        'PRESET_BOUNCE_IN': apply_bounce_in,
+        'PRESET_SLIDE_FROM_SIDE': apply_slide_from_side,
+        'PRESET_FALL_FROM_SKY': apply_fall_from_sky,
+        'PRESET_FLIP_REVEAL': apply_flip_reveal,
+        'PRESET_TYPEWRITER': apply_typewriter,
+        'PRESET_PULSE': apply_pulse,
+        'PRESET_ELASTIC': apply_elastic,
+        'PRESET_STAGGER': apply_stagger,
+    }
+
+def apply_preset_to_selection(operator, context):
+    """
+    Apply the preset chosen in the scene settings to all selected objects. Shared by the
+    apply and live preview operators, which call it directly instead of through bpy.ops.
+    """
+    props = context.scene.animation_preset_props
+    preset = props.preset_enum
+    speed = props.animation_speed
+    
+    # Base duration in frames (will be scaled by speed)
+    base_duration = 30
+    start_frame = context.scene.frame_current
+    
+    # Calculate actual duration based on speed
+    # Faster speed = shorter duration
+    actual_duration = int(base_duration / speed)
+    end_frame = start_frame + actual_duration
+    
+    # Resolve everything that is the same for every object up front
+    apply_preset = ANIM_OT_add_preset.preset_methods[preset]
+    easing = props.animation_easing
+    clear_keyframes = utils.clear_keyframes
+    set_interpolation = utils.set_interpolation
+    selected_objects = context.selected_objects
+    
+    # Settings the keyframes were built from, re-applying identical settings is skipped.
+    # Presets animating temporary copies always run, the copies are gone after playback.
+    settings_signature = f"{preset}:{start_frame}:{speed}:{easing}"
+    skip_unchanged = preset not in ANIM_OT_add_preset.copy_presets
+    skipped = 0
+    
+    # Temporary copies made by the presets in this run and the objects they hid
+    operator.temp_copies = []
+    operator.hidden_objects = []
+    updated_objects = []
+    
+    # Apply the selected preset to all selected objects
+    for obj in selected_objects:
+        # The presets key the object from its current transform, so that is part of the signature
+        signature = f"{settings_signature}:{tuple(obj.location)}:{tuple(obj.rotation_euler)}:{tuple(obj.scale)}"
+        if skip_unchanged and obj.get("_anim_preset_sig") == signature and obj.animation_data and obj.animation_data.action:
+            skipped += 1
+            continue
+        
+        # Clear existing animation
+        clear_keyframes(obj)
+        
+        # Apply the animation for the selected preset
+        apply_preset(operator, context, obj, start_frame, end_frame)
+        
+        # Set interpolation
+        set_interpolation(obj, easing)
+        obj["_anim_preset_sig"] = signature
+        updated_objects.append(obj)
+    
+    if skipped:
+        operator.report({'INFO'}, f"Skipped {skipped} object(s) already animated with these settings")
+    
+    # Tag everything that changed and evaluate the view layer once for the whole selection
+    if updated_objects:
+        for obj in updated_objects:
+            obj.update_tag(refresh={'OBJECT'})
+        for copy in operator.temp_copies:
+            copy.update_tag(refresh={'OBJECT'})
+        context.view_layer.update()
+    
+    # Hand the copies to the shared cleanup, pushed back to the end of this animation
+    if operator.temp_copies:
+        pending_copies.extend(operator.temp_copies)
+        pending_hidden_objects.extend(operator.hidden_objects)
+        schedule_copy_cleanup(max(0.1, actual_duration / context.scene.render.fps))
 
 # Main animation presets panel
 class ANIM_PT_presets_panel(Panel):
@@ -752,7 +736,7 @@ class ANIM_PT_presets_panel(Panel):
 
     @classmethod
     def poll(cls, context):
-        return bool(context.selected_objects)
+        return next(iter(context.view_layer.objects.selected), None) is not None
 
     def draw(self, context):
         layout = self.layout
@@ -768,7 +752,7 @@ class ANIM_PT_presets_panel(Panel):
         # Blue highlighted speed slider
         speed_row = ctrl_box.row()
         speed_row.prop(props, "animation_speed", text="Speed")
-        speed_row.operator("anim.play_animation", text="", icon='PLAY' if not props.is_playing else 'PAUSE')
+        speed_row.operator("anim.play_animation", text="", icon=PLAYBACK_ICONS[props.is_playing])
         
         # Control buttons in a row
         btn_row = ctrl_box.row(align=True)
@@ -810,7 +794,7 @@ class ANIM_PT_presets_panel(Panel):
         
         # Video Preview Button
         preview_op = row.operator("anim.play_preview_video", text="Video Preview", icon='FILE_MOVIE')
-        preview_op.preset_name = props.preset_enum.replace('PRESET_', '')
+        preview_op.preset_name = PRESET_PREVIEW_NAMES[props.preset_enum]
         
         # Preview and Apply buttons
         row.operator("anim.preview_preset", text="Live Preview", icon='PLAY')
@@ -826,26 +810,15 @@ class ANIM_OT_PrevPreset(Operator):
     
     @classmethod
     def poll(cls, context):
-        # Only enable if objects are selected
-        return bool(context.selected_objects)
+        # Only enable if any object is selected, without building the whole selection list
+        return next(iter(context.view_layer.objects.selected), None) is not None
     
     def execute(self, context):
         props = context.scene.animation_preset_props
-        items = props.bl_rna.properties["preset_enum"].enum_items
-        
-        # Find current index
-        current_index = 0
-        for i, item in enumerate(items):
-            if item.identifier == props.preset_enum:
-                current_index = i
-                break
         
         # Set to previous item or wrap around
-        prev_index = current_index - 1
-        if prev_index < 0:
-            prev_index = len(items) - 1
-            
-        props.preset_enum = items[prev_index].identifier
+        current_index = PRESET_INDEX.get(props.preset_enum, 0)
+        props.preset_enum = PRESET_IDS[(current_index - 1) % len(PRESET_IDS)]
         return {'FINISHED'}
 
 class ANIM_OT_NextPreset(Operator):
@@ -854,23 +827,15 @@ class ANIM_OT_NextPreset(Operator):
     
     @classmethod
     def poll(cls, context):
-        # Only enable if objects are selected
-        return bool(context.selected_objects)
+        # Only enable if any object is selected, without building the whole selection list
+        return next(iter(context.view_layer.objects.selected), None) is not None
     
     def execute(self, context):
         props = context.scene.animation_preset_props
-        items = props.bl_rna.properties["preset_enum"].enum_items
-        
-        # Find current index
-        current_index = 0
-        for i, item in enumerate(items):
-            if item.identifier == props.preset_enum:
-                current_index = i
-                break
         
         # Set to next item or wrap around
-        next_index = (current_index + 1) % len(items)
-        props.preset_enum = items[next_index].identifier
+        current_index = PRESET_INDEX.get(props.preset_enum, 0)
+        props.preset_enum = PRESET_IDS[(current_index + 1) % len(PRESET_IDS)]
         return {'FINISHED'}
 
 # Add preview operator
@@ -880,38 +845,36 @@ class ANIM_OT_PreviewPreset(Operator):
     
     @classmethod
     def poll(cls, context):
-        return bool(context.selected_objects)
+        return next(iter(context.view_layer.objects.selected), None) is not None
     
     def execute(self, context):
-        props = context.scene.animation_preset_props
-        preset = props.preset_enum
-        
-        # Store original state
-        original_states = {}
-        for obj in context.selected_objects:
-            original_states[obj] = {
-                'location': obj.location.copy(),
-                'rotation': obj.rotation_euler.copy(),
-                'scale': obj.scale.copy()
-            }
+        # Store original state as plain tuples
+        original_states = {
+            obj: (obj.location[:], obj.rotation_euler[:], obj.scale[:])
+            for obj in context.selected_objects
+        }
         
         # Apply the preset
-        bpy.ops.anim.add_preset()
+        apply_preset_to_selection(self, context)
         
         # Play the animation
         bpy.ops.screen.animation_play()
         
         # Schedule restoration of original state
-        bpy.app.timers.register(lambda: self.restore_original_state(original_states))
+        schedule_cleanup(0.0, functools.partial(self.restore_original_state, original_states))
         
         return {'FINISHED'}
     
-    def restore_original_state(self, original_states):
-        for obj, state in original_states.items():
+    @staticmethod
+    def restore_original_state(original_states):
+        # Pop entries as they are restored so their references are released right away
+        while original_states:
+            obj, (location, rotation, scale) = original_states.popitem()
             if obj:
-                obj.location = state['location']
-                obj.rotation_euler = state['rotation']
-                obj.scale = state['scale']
+                obj.location = location
+                obj.rotation_euler = rotation
+                obj.scale = scale
+                obj.update_tag(refresh={'OBJECT'})
         return None
 
 # Add Preview Video Operator
@@ -930,8 +893,7 @@ class ANIM_OT_PlayPreviewVideo(Operator):
         return True
     
     def execute(self, context):
-        props = context.scene.animation_preset_props
-        preview_path = props.get_preview_path(self.preset_name)
+        preview_path = get_preview_path(self.preset_name)
         
         if not os.path.exists(preview_path):
             self.report({'WARNING'}, f"No preview video found for {self.preset_name}")
@@ -954,15 +916,14 @@ class ANIM_OT_PlayPreviewVideo(Operator):
             bpy.ops.screen.animation_play('INVOKE_DEFAULT')
             
             # Schedule cleanup
-            def cleanup(window, clip):
+            def cleanup():
                 try:
                     bpy.data.movieclips.remove(clip)
-                    bpy.context.window_manager.windows.remove(window)
+                    bpy.context.window_manager.windows.remove(win)
                 except:
                     pass
-                return None
             
-            bpy.app.timers.register(lambda: cleanup(win, clip), first_interval=5.0)
+            schedule_cleanup(5.0, cleanup)
             
         except Exception as e:
             self.report({'ERROR'}, str(e))
@@ -976,7 +937,10 @@ class ANIM_OT_OptimizePreviews(Operator):
     
     def execute(self, context):
         from . import utils
-        if utils.optimize_all_previews():
+        optimized = utils.optimize_all_previews()
+        # Newly written optimized videos take precedence over the cached originals
+        get_preview_path.cache_clear()
+        if optimized:
             self.report({'INFO'}, "Successfully optimized preview videos")
         else:
             self.report({'ERROR'}, "Failed to optimize preview videos")
@@ -1000,11 +964,27 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.animation_preset_props = PointerProperty(type=ANIM_PG_AnimationPresetProperties)
+    for handlers, callback in playback_handlers:
+        if callback not in handlers:
+            handlers.append(callback)
 
 def unregister():
+    for handlers, callback in playback_handlers:
+        if callback in handlers:
+            handlers.remove(callback)
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.animation_preset_props
+    get_preview_path.cache_clear()
+    
+    # Don't leave temporary copies or pending cleanups behind
+    if bpy.app.timers.is_registered(cleanup_pending_copies):
+        bpy.app.timers.unregister(cleanup_pending_copies)
+        cleanup_pending_copies()
+    if bpy.app.timers.is_registered(drain_pending_cleanups):
+        bpy.app.timers.unregister(drain_pending_cleanups)
+    pending_cleanups[:] = [(0.0, callback) for deadline, callback in pending_cleanups]
+    drain_pending_cleanups()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
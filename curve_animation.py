@@ -40,6 +40,8 @@ bl_info = {
 
 import bpy
 import os
+import functools
+from array import array
 from bpy.types import (
     Panel,
     Operator,
@@ -55,6 +57,41 @@ from bpy.props import (
 )
 from . import utils
 
+# Curve enum items, with the identifier order used by the previous/next buttons
+CURVE_ITEMS = [
+    ('Curve Twist', "Curve Twist", "Spiral twist motion"),
+    ('Curve Twist 02', "Curve Twist 02", "Double spiral twist"),
+    ('Curve Twist 03', "Curve Twist 03", "Triple spiral twist"),
+    ('Curve Twist 04', "Curve Twist 04", "Quad spiral twist"),
+    ('Curve Twist 05', "Curve Twist 05", "Pentagonal spiral"),
+    ('Curve Twist 06', "Curve Twist 06", "Hexagonal spiral"),
+    ('Curve Twist 07', "Curve Twist 07", "Wave motion"),
+    ('Curve Twist 08', "Curve Twist 08", "Figure 8 motion"),
+    ('Curve Twist 09', "Curve Twist 09", "Circular motion"),
+    ('Curve Twist 10', "Curve Twist 10", "Infinity loop"),
+    ('Curve Twist 11', "Curve Twist 11", "Spiral descent"),
+    ('NurbsPath Roll', "NurbsPath Roll", "Rolling motion")
+]
+CURVE_IDS = tuple(identifier for identifier, name, description in CURVE_ITEMS)
+CURVE_INDEX = {identifier: i for i, identifier in enumerate(CURVE_IDS)}
+
+@functools.lru_cache(maxsize=4)
+def get_blend_file_path(assets_folder):
+    """Path of Assets.blend in the assets folder, or None if it doesn't exist"""
+    blend_file_path = os.path.join(assets_folder, "Assets.blend")
+    return blend_file_path if os.path.exists(blend_file_path) else None
+
+def set_curve_visibility(curve_obj, show):
+    """Show or hide a curve and its collections, only writing the values that change"""
+    hide = not show
+    if curve_obj.hide_viewport != hide:
+        curve_obj.hide_viewport = hide
+    if curve_obj.hide_render != hide:
+        curve_obj.hide_render = hide
+    for collection in curve_obj.users_collection:
+        if collection.hide_viewport != hide:
+            collection.hide_viewport = hide
+
 class CURVE_PG_AnimationProperties(PropertyGroup):
     """Property group for curve animation settings.
     
@@ -69,20 +106,7 @@ class CURVE_PG_AnimationProperties(PropertyGroup):
     curve_enum: EnumProperty(
         name="Curve Animation",
         description="Select a curve animation preset",
-        items=[
-            ('Curve Twist', "Curve Twist", "Spiral twist motion"),
-            ('Curve Twist 02', "Curve Twist 02", "Double spiral twist"),
-            ('Curve Twist 03', "Curve Twist 03", "Triple spiral twist"),
-            ('Curve Twist 04', "Curve Twist 04", "Quad spiral twist"),
-            ('Curve Twist 05', "Curve Twist 05", "Pentagonal spiral"),
-            ('Curve Twist 06', "Curve Twist 06", "Hexagonal spiral"),
-            ('Curve Twist 07', "Curve Twist 07", "Wave motion"),
-            ('Curve Twist 08', "Curve Twist 08", "Figure 8 motion"),
-            ('Curve Twist 09', "Curve Twist 09", "Circular motion"),
-            ('Curve Twist 10', "Curve Twist 10", "Infinity loop"),
-            ('Curve Twist 11', "Curve Twist 11", "Spiral descent"),
-            ('NurbsPath Roll', "NurbsPath Roll", "Rolling motion"),
-        ],
+        items=CURVE_ITEMS,
         default='Curve Twist'
     ) # type: ignore
     
@@ -210,6 +234,13 @@ class CURVE_PG_AnimationProperties(PropertyGroup):
         min=0.1,
         max=10.0
     ) # type: ignore
+    
+    # Deformation
+    use_subdivision: BoolProperty(
+        name="Subdivide",
+        description="Add a subdivision modifier for smoother deformation along the curve",
+        default=False
+    ) # type: ignore
 
 class CURVE_OT_ApplyCurveAnimation(Operator):
     """Apply curve animation to selected objects.
@@ -242,17 +273,21 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
 
     @classmethod
     def poll(cls, context):
-        return bool(context.selected_objects)
+        return next(iter(context.view_layer.objects.selected), None) is not None
 
     def execute(self, context):
+        return self.apply_to_objects(context, context.selected_objects)
+
+    def apply_to_objects(self, context, objects):
+        """Apply the curve animation to the given objects, shared with the preview operator"""
         # Set progress indicator
         context.window_manager.curve_animation_in_progress = True
-        context.area.tag_redraw()
 
         try:
             settings = context.scene.curve_animation_props
             selected_curve_name = settings.curve_enum
-            selected_objects = context.selected_objects
+            # Stable order by name, so spacing offsets don't depend on selection order
+            selected_objects = sorted(objects, key=lambda o: o.name)
             duration = context.scene.animation_duration
 
             wm = context.window_manager
@@ -286,8 +321,10 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
                 self.report({'ERROR'}, "Assets folder not found.")
                 return {'CANCELLED'}
 
-            blend_file_path = os.path.join(assets_folder, "Assets.blend")
-            if not os.path.exists(blend_file_path):
+            blend_file_path = get_blend_file_path(assets_folder)
+            if not blend_file_path:
+                # Look again next time in case the file is added later
+                get_blend_file_path.cache_clear()
                 self.report({'ERROR'}, "Assets.blend file not found in assets folder.")
                 return {'CANCELLED'}
 
@@ -308,6 +345,19 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
                 # Calculate spacing offset for multiple objects
                 total_objects = len(selected_objects)
                 spacing_offset = settings.spacing if total_objects > 1 else 0
+                time_offsets = [i * spacing_offset / duration for i in range(total_objects)]
+
+                # Calculate adjusted duration based on speed factor
+                adjusted_duration = int(duration / settings.speed_factor)
+
+                # The offset keys and their interpolation only depend on the settings
+                offset_keys = self.build_offset_keys(adjusted_duration, settings)
+                interpolation = settings.ease_type or ('LINEAR' if settings.loop_type == 'OFFSET' else 'SINE')
+
+                # Read the rotation vector once, None when there is nothing to add
+                additional_rotation = tuple(settings.additional_rotation)
+                if not any(additional_rotation):
+                    additional_rotation = None
 
                 try:
                     # Apply animation to each selected object
@@ -315,30 +365,30 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
                         try:
                             # Update progress
                             wm.progress_update(i)
-                            context.area.tag_redraw()
                             
-                            # Calculate offset based on object index
-                            time_offset = (i * spacing_offset) / duration if spacing_offset > 0 else 0
+                            # Offset based on object index
+                            time_offset = time_offsets[i]
                             
                             # Setup object
-                            self.setup_object(obj, curve_obj)
+                            self.setup_object(obj, curve_obj, settings)
                             
-                            # Calculate adjusted duration based on speed factor
-                            adjusted_duration = int(duration / settings.speed_factor)
+                            # Set up constraints once, this also adds the curve following
+                            # constraint when follow_curve is enabled
+                            follow = self.setup_constraints(obj, curve_obj, settings)
+                            if not follow:
+                                self.report({'ERROR'}, "Failed to create follow path constraint")
+                                failed_objects.append(obj.name)
+                                continue
                             
                             # Apply animation with easing
-                            if not self.apply_animation(obj, curve_obj, adjusted_duration, time_offset, settings):
+                            if not self.apply_animation(obj, follow, adjusted_duration, time_offset,
+                                                       offset_keys, interpolation, settings):
                                 failed_objects.append(obj.name)
                                 continue
                             
                             # Apply additional transformations
-                            if settings.follow_curve:
-                                if not self.apply_curve_following(obj, curve_obj, settings):
-                                    failed_objects.append(obj.name)
-                                    continue
-                            
-                            if any(r != 0 for r in settings.additional_rotation):
-                                self.apply_additional_rotation(obj, settings.additional_rotation, adjusted_duration)
+                            if additional_rotation:
+                                self.apply_additional_rotation(obj, additional_rotation, adjusted_duration)
                             
                             if settings.scale_animation:
                                 self.apply_scale_animation(obj, settings.scale_factor, adjusted_duration, time_offset)
@@ -381,18 +431,22 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
             # Clear progress indicator
             if hasattr(context.window_manager, "curve_animation_in_progress"):
                 del context.window_manager.curve_animation_in_progress
-            context.area.tag_redraw()
+            # The area isn't redrawn until the operator returns, so tag it once here
+            if context.area is not None:
+                context.area.tag_redraw()
 
     def get_or_load_curve(self, context, curve_name, blend_file_path):
         curve_obj = bpy.data.objects.get(curve_name)
         
         if not curve_obj:
+            # Append every missing preset curve in one go, so switching presets doesn't reopen the library
             with bpy.data.libraries.load(blend_file_path, link=False) as (data_from, data_to):
-                if curve_name in data_from.objects:
-                    data_to.objects.append(curve_name)
-                else:
+                if curve_name not in data_from.objects:
                     self.report({'ERROR'}, f"Curve '{curve_name}' not found in assets.")
                     return None
+                available = set(data_from.objects)
+                data_to.objects = [name for name in CURVE_IDS
+                                   if name in available and name not in bpy.data.objects]
             curve_obj = bpy.data.objects.get(curve_name)
         
         if not curve_obj or curve_obj.type != 'CURVE':
@@ -402,84 +456,97 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
         return curve_obj
 
     def setup_curve(self, curve_obj):
-        # Unhide curve
-        curve_obj.hide_set(False)
-        curve_obj.hide_viewport = False
-        curve_obj.hide_render = False
-        curve_obj.hide_select = False
+        # Unhide curve, only writing what changes since every write tags the depsgraph
+        dirty = False
+        if curve_obj.hide_get():
+            curve_obj.hide_set(False)
+            dirty = True
+        for attr in ('hide_viewport', 'hide_render', 'hide_select'):
+            if getattr(curve_obj, attr):
+                setattr(curve_obj, attr, False)
+                dirty = True
 
         for collection in curve_obj.users_collection:
-            collection.hide_viewport = False
-            collection.hide_render = False
+            for attr in ('hide_viewport', 'hide_render'):
+                if getattr(collection, attr):
+                    setattr(collection, attr, False)
+                    dirty = True
 
         if not curve_obj.data.use_path:
             curve_obj.data.use_path = True
             curve_obj.data.path_duration = 100
+            dirty = True
 
-        bpy.context.view_layer.update()
+        if dirty:
+            bpy.context.view_layer.update()
 
-    def setup_object(self, obj, curve_obj):
-        # Clear existing animations
+    def setup_object(self, obj, curve_obj, settings):
+        # Clear existing animations, other modifiers are left alone
         obj.constraints.clear()
-        obj.modifiers.clear()
+        obj.rotation_euler = (0, 0, 0)
+        
+        # Empties, such as the preview object, only follow the path
+        if obj.type == 'EMPTY':
+            return
+        modifiers = obj.modifiers
         
-        # Add subdivision modifier for smooth deformation
-        subd = obj.modifiers.new("Subdivision", 'SUBSURF')
-        subd.levels = 2
-        subd.render_levels = 3
-        subd.subdivision_type = 'CATMULL_CLARK'
+        # Remove the curve modifier of a previous run, and its subdivision when that is now off.
+        # The curve modifier is added back last so it always deforms the subdivided mesh
+        stale_types = {'CURVE'} if settings.use_subdivision else {'CURVE', 'SUBSURF'}
+        for i in range(len(modifiers) - 1, -1, -1):
+            modifier = modifiers[i]
+            if modifier.type in stale_types:
+                modifiers.remove(modifier)
+        
+        # Add subdivision modifier for smooth deformation, reusing an existing one
+        if settings.use_subdivision and not any(m.type == 'SUBSURF' for m in modifiers):
+            subd = modifiers.new("Subdivision", 'SUBSURF')
+            subd.levels = 2
+            subd.render_levels = 3
+            subd.subdivision_type = 'CATMULL_CLARK'
 
         # Add curve modifier
-        curve_mod = obj.modifiers.new("Curve Modifier", 'CURVE')
+        curve_mod = modifiers.new("Curve Modifier", 'CURVE')
         curve_mod.object = curve_obj
         curve_mod.deform_axis = 'POS_X'
 
-        # Reset rotation
-        obj.rotation_euler = (0, 0, 0)
-
-    def apply_animation(self, obj, curve_obj, duration, time_offset, settings):
+    def build_offset_keys(self, duration, settings):
+        """Offset factor keys relative to the start frame, shared by every animated object"""
+        # Set initial and final offset factors based on direction
+        start_factor = 1.0 if settings.reverse_direction else 0.0
+        end_factor = 0.0 if settings.reverse_direction else 1.0
+
+        keys = [(0, start_factor)]
+        if settings.loop_animation:
+            if settings.loop_type == 'PING_PONG':
+                keys += self._create_ping_pong_animation(0, duration, start_factor, end_factor)
+            elif settings.loop_type == 'OFFSET':
+                keys += self._create_offset_animation(0, duration, start_factor, end_factor, settings)
+            else:  # REPEAT
+                keys += self._create_repeat_animation(duration, end_factor)
+        else:
+            # Standard non-looping animation
+            keys.append((duration, end_factor))
+        return keys
+
+    def apply_animation(self, obj, follow, duration, time_offset, offset_keys, interpolation, settings):
         """Apply animation to object along curve with specified settings"""
         try:
-            # Set up constraints and get follow path constraint
-            follow = self.setup_constraints(obj, curve_obj, settings)
-            if not follow:
-                self.report({'ERROR'}, "Failed to create follow path constraint")
-                return False
-
             # Calculate keyframe times with offset
             start_frame = 1 + int(time_offset * duration)
-            end_frame = start_frame + duration
-
-            # Set initial and final offset factors based on direction
-            start_factor = 1.0 if settings.reverse_direction else 0.0
-            end_factor = 0.0 if settings.reverse_direction else 1.0
 
-            # Clear existing animation data
-            if obj.animation_data and obj.animation_data.action:
-                for fcurve in obj.animation_data.action.fcurves:
-                    if fcurve.data_path.endswith('offset_factor'):
-                        obj.animation_data.action.fcurves.remove(fcurve)
-
-            # Insert initial keyframe
+            # Key the starting location
             obj.keyframe_insert("location", frame=start_frame)
-            follow.offset_factor = start_factor
-            follow.keyframe_insert('offset_factor', frame=start_frame)
 
-            if settings.loop_animation:
-                if settings.loop_type == 'PING_PONG':
-                    self._create_ping_pong_animation(follow, start_frame, duration, start_factor, end_factor)
-                elif settings.loop_type == 'OFFSET':
-                    self._create_offset_animation(follow, start_frame, duration, start_factor, end_factor, settings)
-                else:  # REPEAT
-                    self._create_repeat_animation(follow, start_frame, end_frame, end_factor)
-            else:
-                # Standard non-looping animation
-                follow.offset_factor = end_factor
-                follow.keyframe_insert('offset_factor', frame=end_frame)
-
-            # Apply interpolation
-            self.set_keyframe_interpolation(obj, settings.ease_type, 
-                'LINEAR' if settings.loop_type == 'OFFSET' else 'SINE')
+            # Shift the shared offset keys to this object's start frame
+            keys = [(start_frame + frame, factor) for frame, factor in offset_keys]
+
+            # Keys are written with their interpolation, no separate pass over the fcurves
+            fcurve = self.write_offset_keyframes(obj, follow, keys, interpolation)
+            if settings.loop_animation and settings.loop_type == 'REPEAT':
+                cycles = fcurve.modifiers.new('CYCLES')
+                cycles.mode_before = 'REPEAT'
+                cycles.mode_after = 'REPEAT'
 
             return True
 
@@ -487,49 +554,54 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
             self.report({'ERROR'}, f"Animation failed: {str(e)}")
             return False
 
-    def _create_ping_pong_animation(self, follow, start_frame, duration, start_factor, end_factor):
-        """Create ping-pong style animation"""
+    def write_offset_keyframes(self, obj, follow, keys, interpolation):
+        """Write the offset factor keyframes and their interpolation in one batch instead of one keyframe_insert per key"""
+        data_path = follow.path_from_id('offset_factor')
+        anim_data = obj.animation_data or obj.animation_data_create()
+        action = anim_data.action
+        if action is None:
+            action = bpy.data.actions.new(name=f"{obj.name}Action")
+            anim_data.action = action
+
+        # setup_constraints already cleared the previous animation, so the offset has no fcurve yet
+        fcurve = action.fcurves.new(data_path, index=0, action_group=follow.name)
+
+        count = len(keys)
+        co = array('f', [component for key in keys for component in key])
+        points = fcurve.keyframe_points
+        points.add(count)
+        points.foreach_set('co', co)
+        points.foreach_set('interpolation', utils.interpolation_array(interpolation, count))
+        handle_types = utils.handle_type_array('AUTO_CLAMPED', count)
+        points.foreach_set('handle_left_type', handle_types)
+        points.foreach_set('handle_right_type', handle_types)
+        fcurve.update()
+
+        # Leave the constraint at its final value, as keyframe_insert would
+        follow.offset_factor = keys[-1][1]
+        return fcurve
+
+    def _create_ping_pong_animation(self, start_frame, duration, start_factor, end_factor):
+        """Create ping-pong style animation keys"""
         mid_frame = start_frame + duration
         end_frame = start_frame + (duration * 2)
-        
-        follow.offset_factor = end_factor
-        follow.keyframe_insert('offset_factor', frame=mid_frame)
-        follow.offset_factor = start_factor
-        follow.keyframe_insert('offset_factor', frame=end_frame)
+        return [(mid_frame, end_factor), (end_frame, start_factor)]
 
-    def _create_offset_animation(self, follow, start_frame, duration, start_factor, end_factor, settings):
-        """Create offset-based continuous animation"""
+    def _create_offset_animation(self, start_frame, duration, start_factor, end_factor, settings):
+        """Create offset-based continuous animation keys"""
+        keys = []
         for i in range(1, 4):
             frame = start_frame + (duration * i)
             offset = i * settings.loop_offset
             factor = (start_factor + offset) if settings.reverse_direction else (end_factor + offset)
             factor = min(max(factor, 0.0), 1.0)  # Clamp between 0 and 1
-            
-            follow.offset_factor = factor
-            follow.keyframe_insert('offset_factor', frame=frame)
+            keys.append((frame, factor))
+        return keys
+
+    def _create_repeat_animation(self, end_frame, end_factor):
+        """Create repeating animation keys, the cycles modifier is added once the fcurve exists"""
+        return [(end_frame, end_factor)]
 
-    def _create_repeat_animation(self, follow, start_frame, end_frame, end_factor):
-        """Create repeating animation"""
-        follow.offset_factor = end_factor
-        follow.keyframe_insert('offset_factor', frame=end_frame)
-        
-        if follow.id_data.animation_data and follow.id_data.animation_data.action:
-            for fcurve in follow.id_data.animation_data.action.fcurves:
-                if fcurve.data_path.endswith('offset_factor'):
-                    cycles = fcurve.modifiers.new('CYCLES')
-                    cycles.mode_before = 'REPEAT'
-                    cycles.mode_after = 'REPEAT'
-
-    def set_keyframe_interpolation(self, obj, interpolation_type, default_type='SINE'):
-        """Helper method to set keyframe interpolation"""
-        if obj.animation_data and obj.animation_data.action:
-            for fcurve in obj.animation_data.action.fcurves:
-                if fcurve.data_path.endswith('offset_factor'):
-                    for keyframe in fcurve.keyframe_points:
-                        keyframe.interpolation = interpolation_type or default_type
-                        keyframe.handle_left_type = 'AUTO_CLAMPED'
-                        keyframe.handle_right_type = 'AUTO_CLAMPED'
-        
     def cleanup_animation_data(self, obj):
         """Clean up existing animation data and constraints"""
         # Remove existing animation data
@@ -580,8 +652,10 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
                     track.show_expanded = False
                     
                     # Move track constraint before follow path for proper order
-                    while obj.constraints.find(track.name) < obj.constraints.find(follow.name):
-                        bpy.ops.constraint.move_down({'constraint': track})
+                    track_index = obj.constraints.find(track.name)
+                    follow_index = obj.constraints.find(follow.name)
+                    if track_index > follow_index:
+                        obj.constraints.move(track_index, follow_index)
             
             return follow
             
@@ -590,48 +664,22 @@ class CURVE_OT_ApplyCurveAnimation(Operator):
             self.cleanup_animation_data(obj)  # Clean up on failure
             return None
 
-    def apply_curve_following(self, obj, curve_obj, settings):
-        """Apply curve following constraints"""
-        return self.setup_constraints(obj, curve_obj, settings)
-
     def apply_additional_rotation(self, obj, rotation, duration):
-        # Add keyframes for additional rotation
-        obj.keyframe_insert('rotation_euler', frame=1)
-        obj.rotation_euler = rotation
-        obj.keyframe_insert('rotation_euler', frame=duration)
+        # Add keyframes for additional rotation, one row per axis
+        rotations = list(zip(obj.rotation_euler, rotation))
+        utils.bulk_insert_keyframes(obj, 'rotation_euler', (1, duration), rotations)
 
     def apply_scale_animation(self, obj, scale_factor, duration, time_offset):
         start_frame = 1 + int(time_offset * duration)
         mid_frame = start_frame + int(duration * 0.5)
         end_frame = start_frame + duration
         
-        # Create scale animation
-        obj.scale = (1, 1, 1)
-        obj.keyframe_insert('scale', frame=start_frame)
-        obj.scale = scale_factor
-        obj.keyframe_insert('scale', frame=mid_frame)
-        obj.scale = (1, 1, 1)
-        obj.keyframe_insert('scale', frame=end_frame)
+        # Create scale animation, one row per axis
+        scales = [(1.0, factor, 1.0) for factor in scale_factor]
+        utils.bulk_insert_keyframes(obj, 'scale', (start_frame, mid_frame, end_frame), scales)
 
     def update_curve_visibility(self, curve_obj, show):
-        curve_obj.hide_viewport = not show
-        curve_obj.hide_render = not show
-        for collection in curve_obj.users_collection:
-            collection.hide_viewport = not show
-
-            # Set visibility based on toggle
-            show = context.scene.show_animation_paths
-            curve_obj.hide_viewport = not show
-            curve_obj.hide_render = not show
-            for collection in curve_obj.users_collection:
-                collection.hide_viewport = not show
-
-            self.report({'INFO'}, f"Applied curve: {selected_curve_name}")
-            return {'FINISHED'}
-
-        except Exception as e:
-            self.report({'ERROR'}, str(e))
-            return {'CANCELLED'}
+        set_curve_visibility(curve_obj, show)
 
 class CURVE_OT_PrevCurve(Operator):
     """Switch to the previous curve animation preset."""
@@ -642,13 +690,12 @@ class CURVE_OT_PrevCurve(Operator):
 
     @classmethod
     def poll(cls, context):
-        return bool(context.selected_objects)
+        return next(iter(context.view_layer.objects.selected), None) is not None
 
     def execute(self, context):
         props = context.scene.curve_animation_props
-        items = props.bl_rna.properties["curve_enum"].enum_items
-        current = [i.identifier for i in items].index(props.curve_enum)
-        props.curve_enum = items[(current - 1) % len(items)].identifier
+        current = CURVE_INDEX.get(props.curve_enum, 0)
+        props.curve_enum = CURVE_IDS[(current - 1) % len(CURVE_IDS)]
         return {'FINISHED'}
 
 class CURVE_OT_NextCurve(Operator):
@@ -660,13 +707,12 @@ class CURVE_OT_NextCurve(Operator):
 
     @classmethod
     def poll(cls, context):
-        return bool(context.selected_objects)
+        return next(iter(context.view_layer.objects.selected), None) is not None
 
     def execute(self, context):
         props = context.scene.curve_animation_props
-        items = props.bl_rna.properties["curve_enum"].enum_items
-        current = [i.identifier for i in items].index(props.curve_enum)
-        props.curve_enum = items[(current + 1) % len(items)].identifier
+        current = CURVE_INDEX.get(props.curve_enum, 0)
+        props.curve_enum = CURVE_IDS[(current + 1) % len(CURVE_IDS)]
         return {'FINISHED'}
 
 class CURVE_PT_animation_panel(Panel):
@@ -760,12 +806,13 @@ class CURVE_PT_animation_panel(Panel):
         rot_col = transform_box.column(align=True)
         rot_col.prop(props, "follow_curve", text="Follow Curve Path")
         
-        # Axis controls (only enabled if follow_curve is True)
-        axis_box = rot_col.box()
-        axis_box.enabled = props.follow_curve
-        axis_box.label(text="Follow Path Orientation")
-        axis_box.prop(props, "follow_axis", text="Forward")
-        axis_box.prop(props, "up_axis", text="Up")
+        # Axis controls (only enabled if follow_curve is True), a sub-column
+        # rather than a nested box keeps the layout lighter
+        axis_col = rot_col.column(align=True)
+        axis_col.enabled = props.follow_curve
+        axis_col.label(text="Follow Path Orientation")
+        axis_col.prop(props, "follow_axis", text="Forward")
+        axis_col.prop(props, "up_axis", text="Up")
         
         rot_col.prop(props, "additional_rotation", text="Additional Rotation")
         
@@ -774,6 +821,8 @@ class CURVE_PT_animation_panel(Panel):
         scale_col.prop(props, "scale_animation", text="Animate Scale")
         if props.scale_animation:
             scale_col.prop(props, "scale_factor", text="Scale Factor")
+        
+        transform_box.prop(props, "use_subdivision", text="Subdivide")
 
         # Preview and Apply Box
         preview_box = layout.box()
@@ -791,7 +840,7 @@ class CURVE_PT_animation_panel(Panel):
         
         # Check if curve exists
         curve_name = props.curve_enum
-        curve_exists = bool(bpy.data.objects.get(curve_name))
+        curve_exists = cached_curve_exists(curve_name)
         
         row = vis_box.row()
         row.enabled = curve_exists
@@ -799,26 +848,83 @@ class CURVE_PT_animation_panel(Panel):
         if not curve_exists:
             row.label(text="No curve selected/applied", icon='INFO')
 
-# Toggle curve visibility update
+# Whether an object named after each curve preset exists, the panel checks it on every redraw
+curve_exists_cache = {}
+
+def cached_curve_exists(curve_name):
+    exists = curve_exists_cache.get(curve_name)
+    if exists is None:
+        exists = curve_exists_cache[curve_name] = curve_name in bpy.data.objects
+    return exists
+
+@bpy.app.handlers.persistent
+def clear_curve_exists_cache(scene=None, depsgraph=None):
+    # Depsgraph updates only matter when objects changed, loading a file always clears
+    if depsgraph is None or depsgraph.id_type_updated('OBJECT'):
+        curve_exists_cache.clear()
+
+# Toggle curve visibility update, notified through msgbus rather than the property setter
 def update_path_visibility(self, context):
     show = context.scene.show_animation_paths
     settings = context.scene.curve_animation_props
     curve_name = settings.curve_enum
     
+    # Only the latest state per curve is applied, on the next timer tick
+    pending_visibility[curve_name] = show
+    if not bpy.app.timers.is_registered(flush_path_visibility):
+        bpy.app.timers.register(flush_path_visibility, first_interval=1 / 60)
+
+# Latest requested visibility per curve name, waiting for flush_path_visibility
+pending_visibility = {}
+
+def flush_path_visibility():
     # Only toggle visibility for the selected/applied curve
-    curve_obj = bpy.data.objects.get(curve_name)
-    if curve_obj and curve_obj.type == 'CURVE':
-        curve_obj.hide_viewport = not show
-        curve_obj.hide_render = not show
-        for collection in curve_obj.users_collection:
-            collection.hide_viewport = not show
+    for curve_name, show in pending_visibility.items():
+        curve_obj = bpy.data.objects.get(curve_name)
+        if curve_obj and curve_obj.type == 'CURVE':
+            set_curve_visibility(curve_obj, show)
+    pending_visibility.clear()
+    return None
+
+# Owner of the msgbus subscription following show_animation_paths
+msgbus_owner = object()
+
+def on_show_animation_paths():
+    context = bpy.context
+    update_path_visibility(context.scene, context)
+
+def subscribe_path_visibility():
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.Scene, "show_animation_paths"),
+        owner=msgbus_owner,
+        args=(),
+        notify=on_show_animation_paths,
+    )
+
+@bpy.app.handlers.persistent
+def resubscribe_path_visibility(*args):
+    # Loading a file clears every msgbus subscription
+    subscribe_path_visibility()
+
+@bpy.app.handlers.persistent
+def forget_pending_previews(*args):
+    # Loading a file drops the frame change handler, and the pending names now refer to
+    # objects of the previous file, so a same-named object of the new one is left alone
+    pending_preview_names.clear()
+
+app_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, clear_curve_exists_cache),
+    (bpy.app.handlers.load_post, clear_curve_exists_cache),
+    (bpy.app.handlers.load_post, resubscribe_path_visibility),
+    (bpy.app.handlers.load_post, forget_pending_previews),
+)
 
-class CURVE_OT_PreviewAnimation(Operator):
+class CURVE_OT_PreviewAnimation(CURVE_OT_ApplyCurveAnimation):
     """Preview the curve animation on a temporary object.
     
     This operator:
     - Creates a temporary preview object
-    - Applies the selected curve animation
+    - Applies the selected curve animation directly, without running the apply operator
     - Plays the animation in the viewport
     - Automatically cleans up after playback
     """
@@ -829,7 +935,7 @@ class CURVE_OT_PreviewAnimation(Operator):
     
     @classmethod
     def poll(cls, context):
-        return bool(context.selected_objects)
+        return next(iter(context.view_layer.objects.selected), None) is not None
     
     def execute(self, context):
         settings = context.scene.curve_animation_props
@@ -845,30 +951,38 @@ class CURVE_OT_PreviewAnimation(Operator):
         context.scene.collection.objects.link(preview_obj)
         
         # Apply the curve animation to the preview object
-        preview_obj.select_set(True)
-        bpy.ops.curve.apply_animation()
+        if 'FINISHED' not in self.apply_to_objects(context, [preview_obj]):
+            bpy.data.objects.remove(preview_obj, do_unlink=True)
+            return {'CANCELLED'}
         
         # Play the animation
         bpy.ops.screen.animation_play()
         
-        # Schedule removal of preview object after animation
-        bpy.app.timers.register(lambda: self.cleanup_preview(preview_obj))
+        # Remove the preview object once playback reaches the last frame,
+        # tracked by name so the reference survives undo
+        pending_preview_names.add(preview_obj.name)
+        frame_handlers = bpy.app.handlers.frame_change_post
+        if cleanup_previews_at_end not in frame_handlers:
+            frame_handlers.append(cleanup_previews_at_end)
         
         return {'FINISHED'}
     
-    def cleanup_preview(self, preview_obj):
+    @staticmethod
+    def cleanup_preview(preview_name):
         """Clean up the temporary preview object and its data.
         
         Args:
-            preview_obj: The temporary object to remove
+            preview_name: Name of the temporary object to remove
             
         Returns:
             None to unregister the timer
         """
         try:
-            if preview_obj and preview_obj.name in bpy.data.objects:
+            preview_obj = bpy.data.objects.get(preview_name)
+            if preview_obj:
                 # Stop animation playback
-                if bpy.context.screen.is_animation_playing:
+                screen = bpy.context.screen
+                if screen and screen.is_animation_playing:
                     bpy.ops.screen.animation_cancel()
                 
                 # Remove object and its data
@@ -881,6 +995,20 @@ class CURVE_OT_PreviewAnimation(Operator):
         finally:
             return None  # Unregister timer
 
+# Names of preview objects waiting for playback to reach the last frame
+pending_preview_names = set()
+
+def cleanup_previews_at_end(scene, depsgraph=None):
+    """One-shot frame change handler, removes the preview objects after the last frame"""
+    if scene.frame_current < scene.frame_end:
+        return
+    bpy.app.handlers.frame_change_post.remove(cleanup_previews_at_end)
+    
+    # Objects are removed from a timer rather than inside the frame change handler
+    for preview_name in pending_preview_names:
+        bpy.app.timers.register(functools.partial(CURVE_OT_PreviewAnimation.cleanup_preview, preview_name))
+    pending_preview_names.clear()
+
 # Define classes to register
 classes = [
     CURVE_PG_AnimationProperties,
@@ -891,54 +1019,86 @@ classes = [
     CURVE_PT_animation_panel
 ]
 
+# Properties added to Blender types on register, removed in reverse order on unregister
+registered_properties = (
+    (bpy.types.Scene, "curve_animation_props", PointerProperty(type=CURVE_PG_AnimationProperties)),
+    (bpy.types.Scene, "animation_duration", IntProperty(
+        name="Animation Duration",
+        description="Duration of the animation in frames",
+        default=30,
+        min=10,
+        max=300
+    )),
+    (bpy.types.Scene, "show_animation_paths", BoolProperty(
+        name="Show Animation Paths",
+        description="Toggle visibility of the selected/applied curve",
+        default=False
+    )),
+    # Progress tracking
+    (bpy.types.WindowManager, "curve_animation_in_progress", BoolProperty(
+        name="Animation in Progress",
+        description="Indicates if a curve animation is currently being processed",
+        default=False,
+        options={'HIDDEN'}  # Hide from UI, only for internal use
+    )),
+)
+
+# Set between register() and unregister(), so a second register() is a no-op
+registered = False
+
 def register():
-    try:
-        # Register classes
-        for cls in classes:
+    global registered
+    if registered:
+        return
+    
+    # Classes still registered from a previous enable are left as they are
+    for cls in classes:
+        if not cls.is_registered:
             bpy.utils.register_class(cls)
 
-        # Register scene properties
-        bpy.types.Scene.curve_animation_props = PointerProperty(type=CURVE_PG_AnimationProperties)
-        bpy.types.Scene.animation_duration = IntProperty(
-            name="Animation Duration",
-            description="Duration of the animation in frames",
-            default=30,
-            min=10,
-            max=300
-        )
-        bpy.types.Scene.show_animation_paths = BoolProperty(
-            name="Show Animation Paths",
-            description="Toggle visibility of the selected/applied curve",
-            default=False,
-            update=update_path_visibility
-        )
-        
-        # Register window manager properties for progress tracking
-        bpy.types.WindowManager.curve_animation_in_progress = BoolProperty(
-            name="Animation in Progress",
-            description="Indicates if a curve animation is currently being processed",
-            default=False,
-            options={'HIDDEN'}  # Hide from UI, only for internal use
-        )
+    for owner, name, prop in registered_properties:
+        setattr(owner, name, prop)
+
+    for handlers, callback in app_handlers:
+        if callback not in handlers:
+            handlers.append(callback)
+    subscribe_path_visibility()
+    
+    # Only set once everything is in place, so a failed register() can be retried
+    registered = True
  
 def unregister():
-    try:
-        # Clean up window manager properties first
-        if hasattr(bpy.types.WindowManager, "curve_animation_in_progress"):
-            del bpy.types.WindowManager.curve_animation_in_progress
-
-        # Clean up scene properties
-        if hasattr(bpy.types.Scene, "show_animation_paths"):
-            del bpy.types.Scene.show_animation_paths
-        if hasattr(bpy.types.Scene, "animation_duration"):
-            del bpy.types.Scene.animation_duration
-        if hasattr(bpy.types.Scene, "curve_animation_props"):
-            del bpy.types.Scene.curve_animation_props
-
-        # Unregister classes in reverse order
-        for cls in reversed(classes):
-            try:
-                bpy.utils.unregister_class(cls)
-            except RuntimeError:
-                print(f"Failed to unregister {cls.__name__}")
-                
+    global registered
+    registered = False
+    
+    bpy.msgbus.clear_by_owner(msgbus_owner)
+    for handlers, callback in app_handlers:
+        if callback in handlers:
+            handlers.remove(callback)
+    curve_exists_cache.clear()
+    get_blend_file_path.cache_clear()
+
+    # Don't leave preview objects behind
+    if cleanup_previews_at_end in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(cleanup_previews_at_end)
+    for preview_name in pending_preview_names:
+        CURVE_OT_PreviewAnimation.cleanup_preview(preview_name)
+    pending_preview_names.clear()
+
+    # Apply a pending visibility toggle now rather than after unregistering
+    if bpy.app.timers.is_registered(flush_path_visibility):
+        bpy.app.timers.unregister(flush_path_visibility)
+        flush_path_visibility()
+
+    for owner, name, prop in reversed(registered_properties):
+        if hasattr(owner, name):
+            delattr(owner, name)
+
+    # Unregister classes in reverse order
+    for cls in reversed(classes):
+        if not cls.is_registered:
+            continue
+        try:
+            bpy.utils.unregister_class(cls)
+        except RuntimeError:
+            print(f"Failed to unregister {cls.__name__}")
@@ -1,57 +1,91 @@
 import bpy
+import functools
 from bpy.props import EnumProperty, PointerProperty, IntProperty, BoolProperty
 
+@functools.lru_cache(maxsize=None)
+def cached_presets():
+    """(icon, name, id, description) of each preset from animation_presets.py, read once
+    since they don't change at runtime; call cached_presets.cache_clear() if they do"""
+    from . import animation_presets
+    return tuple(
+        (preset.get("preview_icon", 0), preset["name"], preset["id"], preset["description"])
+        for preset in animation_presets.get_presets()
+    )
+
 class ANIM_PT_MainPanel(bpy.types.Panel):
-    """Main Panel for Animation Presets and Curve Animation"""
+    """Main Panel for Animation Presets and Curve Animation, its sections are sub-panels
+    so Blender skips drawing the ones that are collapsed"""
     bl_label = "Animation Presets"
     bl_idname = "ANIM_PT_MainPanel"
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'UI'
     bl_category = "Animation"
 
+class ANIM_PT_Presets(bpy.types.Panel):
+    """Animation Presets section of the main panel"""
+    bl_label = "Animation Presets"
+    bl_idname = "ANIM_PT_Presets"
+    bl_parent_id = "ANIM_PT_MainPanel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Animation"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        self.layout.label(icon='ANIM')
+
     def draw(self, context):
         layout = self.layout
         
-        # Animation Presets Section
-        box = layout.box()
-        row = box.row()
-        row.label(text="Animation Presets", icon='ANIM')
-        
         # Grid layout for presets
-        grid = box.grid_flow(row_major=True, columns=2, align=True)
-        
-        # Get presets from animation_presets.py
-        from . import animation_presets
-        presets = animation_presets.get_presets()
+        grid = layout.grid_flow(row_major=True, columns=2, align=True)
         
-        for preset in presets:
+        for icon, name, preset_id, description in cached_presets():
             col = grid.column(align=True)
-            col.template_icon(icon_value=preset.get("preview_icon", 0))
-            op = col.operator("anim.apply_preset", text=preset["name"])
-            op.preset_id = preset["id"]
-            col.label(text=preset["description"])
-        
-        # Animate Along Curve Section
-        box = layout.box()
-        row = box.row()
-        row.label(text="Animate Along Curve", icon='CURVE_DATA')
+            col.template_icon(icon_value=icon)
+            op = col.operator("anim.apply_preset", text=name)
+            op.preset_id = preset_id
+            col.label(text=description)
+
+class ANIM_PT_AlongCurve(bpy.types.Panel):
+    """Animate Along Curve section of the main panel"""
+    bl_label = "Animate Along Curve"
+    bl_idname = "ANIM_PT_AlongCurve"
+    bl_parent_id = "ANIM_PT_MainPanel"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Animation"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header(self, context):
+        self.layout.label(icon='CURVE_DATA')
+
+    def draw(self, context):
+        layout = self.layout
         
-        col = box.column(align=True)
+        col = layout.column(align=True)
         col.prop_search(context.scene, "aac_target_curve", context.scene, "objects", text="Target Curve")
         col.prop(context.scene, "aac_start_frame", text="Start Frame")
         col.prop(context.scene, "aac_end_frame", text="End Frame")
         col.prop(context.scene, "aac_auto_orient", text="Auto Orient")
         
         # Preview section
-        preview_box = box.box()
+        preview_box = layout.box()
         preview_box.label(text="Preview", icon='RENDER_ANIMATION')
         preview_box.template_icon(icon_value=0)  # Will be replaced with actual preview
         
         # Apply button
-        col = box.column(align=True)
+        col = layout.column(align=True)
         col.scale_y = 1.5
         col.operator("anim.animate_along_curve", text="Apply Curve Animation", icon='PLAY')
 
+# Parent panel first, sub-panels after it
+classes = (
+    ANIM_PT_MainPanel,
+    ANIM_PT_Presets,
+    ANIM_PT_AlongCurve,
+)
+
 def register():
     bpy.types.Scene.aac_target_curve = PointerProperty(
         name="Target Curve",
@@ -76,7 +110,8 @@ def register():
         description="Automatically orient along the curve"
     )
     
-    bpy.utils.register_class(ANIM_PT_MainPanel)
+    for cls in classes:
+        bpy.utils.register_class(cls)
 
 def unregister():
     del bpy.types.Scene.aac_target_curve
@@ -84,4 +119,6 @@ def unregister():
     del bpy.types.Scene.aac_end_frame
     del bpy.types.Scene.aac_auto_orient
     
-    bpy.utils.unregister_class(ANIM_PT_MainPanel)
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    cached_presets.cache_clear()
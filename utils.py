@@ -4,6 +4,38 @@
 
 import bpy # type: ignore
 import os
+import functools
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+
+# Integer values of the keyframe interpolation, easing and handle type enums, for foreach_set
+keyframe_props = bpy.types.Keyframe.bl_rna.properties
+interpolation_values = {item.identifier: item.value for item in keyframe_props['interpolation'].enum_items}
+easing_values = {item.identifier: item.value for item in keyframe_props['easing'].enum_items}
+handle_type_values = {item.identifier: item.value for item in keyframe_props['handle_left_type'].enum_items}
+
+@functools.lru_cache(maxsize=None)
+def interpolation_array(interpolation, count):
+    """Read-only int32 array of an interpolation enum value, shared by every preset of the same length"""
+    values = np.full(count, interpolation_values[interpolation], dtype=np.int32)
+    values.flags.writeable = False
+    return values
+
+@functools.lru_cache(maxsize=None)
+def easing_array(easing, count):
+    """Read-only int32 array of an easing enum value, shared by every preset of the same length"""
+    values = np.full(count, easing_values[easing], dtype=np.int32)
+    values.flags.writeable = False
+    return values
+
+@functools.lru_cache(maxsize=None)
+def handle_type_array(handle_type, count):
+    """Read-only int32 array of a keyframe handle type enum value"""
+    values = np.full(count, handle_type_values[handle_type], dtype=np.int32)
+    values.flags.writeable = False
+    return values
 
 def insert_keyframe(obj, data_path, frame, value):
     """
@@ -20,6 +52,98 @@ def insert_keyframe(obj, data_path, frame, value):
     setattr(obj, data_path, value)  # Set the property
     obj.keyframe_insert(data_path, frame=frame)  # Insert keyframe
 
+def bulk_insert_keyframes(obj, data_path, frames, values, interpolation=None, easing=None, action=None, group="Object Transforms", cull_flat=False):
+    """
+    Inserts all keyframes of a property in one batch instead of one keyframe_insert per frame.
+    Existing keyframes on the property's fcurves are replaced. When a frame appears more than
+    once only its last value is kept, as with keyframe_insert.
+
+    :param obj: Blender object to animate
+    :param data_path: The property path (e.g., 'location', 'rotation_euler')
+    :param frames: The frame numbers, one per keyframe (sequence or NumPy array)
+    :param values: The values to keyframe, one row per channel (array index) holding a float per frame
+    :param interpolation: Optional interpolation type (e.g., "SINE", "BACK", "ELASTIC"),
+                          or an array of interpolation enum values, one per keyframe
+    :param easing: Optional easing type (e.g., "EASE_IN", "EASE_OUT", "EASE_IN_OUT"),
+                   or an array of easing enum values, one per keyframe
+    :param action: Optional action of the object returned by a previous call, saves looking it up again
+    :param group: Action group for newly created fcurves, keyframe_insert uses "Object Transforms" for transforms
+    :param cull_flat: Leave out interior keyframes that repeat the value of both neighbours. Only safe
+                      when the segments stay flat between equal values, which isn't the case for ELASTIC
+                      (it oscillates regardless), so keys next to an ELASTIC segment are always kept.
+                      The first and last keyframe of every channel are always kept.
+    :return: The action the keyframes were inserted into
+    """
+    if obj is None or len(frames) == 0:
+        return action
+    
+    frames = np.asarray(frames, dtype=np.float32)
+    values = np.asarray(values, dtype=np.float32)
+    
+    # A freshly created action has no fcurves to look up
+    new_action = False
+    if action is None:
+        anim_data = obj.animation_data or obj.animation_data_create()
+        action = anim_data.action
+        if action is None:
+            action = bpy.data.actions.new(name=f"{obj.name}Action")
+            anim_data.action = action
+            new_action = True
+    
+    # keyframe_insert overwrote a key on an existing frame, so keep only the last value
+    # given for each frame (frames computed with int() can repeat at high speeds)
+    if np.any(np.diff(frames) <= 0):
+        last = len(frames) - 1 - np.unique(frames[::-1], return_index=True)[1]
+        frames = frames[last]
+        values = values[:, last]
+        if interpolation is not None and not isinstance(interpolation, str):
+            interpolation = np.asarray(interpolation)[last]
+        if easing is not None and not isinstance(easing, str):
+            easing = np.asarray(easing)[last]
+    
+    count = len(frames)
+    if isinstance(interpolation, str):
+        interpolation = interpolation_array(interpolation, count)
+    if isinstance(easing, str):
+        easing = easing_array(easing, count)
+    
+    keep = np.ones(count, dtype=bool)
+    
+    # Interior keyframes that may be dropped when flat: the segments on both sides of them
+    # have to stay flat, which ELASTIC doesn't between equal values
+    cullable = np.full(max(count - 2, 0), cull_flat, dtype=bool)
+    if cull_flat and interpolation is not None:
+        elastic = np.asarray(interpolation) == interpolation_values['ELASTIC']
+        cullable = ~(elastic[:-2] | elastic[1:-1])
+    
+    fcurves = action.fcurves
+    for index, channel in enumerate(values):
+        fcurve = None if new_action else fcurves.find(data_path, index=index)
+        if fcurve is None:
+            fcurve = fcurves.new(data_path, index=index, action_group=group)
+        else:
+            fcurve.keyframe_points.clear()
+        
+        # Drop keyframes that don't change the curve, if asked to
+        keep[1:-1] = ~cullable | (channel[1:-1] != channel[:-2]) | (channel[1:-1] != channel[2:])
+        kept = np.count_nonzero(keep)
+        co = np.empty(2 * kept, dtype=np.float32)
+        co[0::2] = frames[keep]
+        co[1::2] = channel[keep]
+        
+        points = fcurve.keyframe_points
+        points.add(kept)
+        points.foreach_set('co', co)
+        if interpolation is not None:
+            points.foreach_set('interpolation', interpolation[keep])
+        if easing is not None:
+            points.foreach_set('easing', easing[keep])
+        fcurve.update()
+    
+    # Leave the property at its final value, as keyframe_insert would
+    setattr(obj, data_path, values[:, -1].tolist())
+    return action
+
 def clear_keyframes(obj):
     """
     Clears all keyframes of the given object.
@@ -36,14 +160,18 @@ def set_interpolation(obj, interpolation_type="LINEAR"):
     :param obj: Blender object to modify fcurves
     :param interpolation_type: Type of interpolation (e.g., "LINEAR", "BEZIER", "CONSTANT")
     """
-    if obj and obj.animation_data and obj.animation_data.action:
-        for fcurve in obj.animation_data.action.fcurves:
-            for keyframe in fcurve.keyframe_points:
-                keyframe.interpolation = interpolation_type
+    anim_data = obj.animation_data if obj else None
+    action = anim_data.action if anim_data else None
+    if action:
+        for fcurve in action.fcurves:
+            points = fcurve.keyframe_points
+            points.foreach_set('interpolation', interpolation_array(interpolation_type, len(points)))
+            fcurve.update()
 
 def animate_location(obj, start_frame, end_frame, start_pos, end_pos):
     """
     Animates an object's location from start_pos to end_pos between start_frame and end_frame.
+    Existing location keyframes are replaced.
 
     :param obj: Blender object
     :param start_frame: Start frame for animation
@@ -52,12 +180,13 @@ def animate_location(obj, start_frame, end_frame, start_pos, end_pos):
     :param end_pos: Ending position (tuple of 3 floats)
     """
     if obj:
-        insert_keyframe(obj, "location", start_frame, start_pos)
-        insert_keyframe(obj, "location", end_frame, end_pos)
+        # One row per axis, both keyframes written in one batch
+        bulk_insert_keyframes(obj, "location", (start_frame, end_frame), list(zip(start_pos, end_pos)))
 
 def animate_rotation(obj, start_frame, end_frame, start_rot, end_rot):
     """
     Animates an object's rotation from start_rot to end_rot between start_frame and end_frame.
+    Existing rotation keyframes are replaced.
 
     :param obj: Blender object
     :param start_frame: Start frame for animation
@@ -66,12 +195,13 @@ def animate_rotation(obj, start_frame, end_frame, start_rot, end_rot):
     :param end_rot: Ending rotation (tuple of 3 floats in radians)
     """
     if obj:
-        insert_keyframe(obj, "rotation_euler", start_frame, start_rot)
-        insert_keyframe(obj, "rotation_euler", end_frame, end_rot)
+        # One row per axis, both keyframes written in one batch
+        bulk_insert_keyframes(obj, "rotation_euler", (start_frame, end_frame), list(zip(start_rot, end_rot)))
 
 def animate_scale(obj, start_frame, end_frame, start_scale, end_scale):
     """
     Animates an object's scale from start_scale to end_scale between start_frame and end_frame.
+    Existing scale keyframes are replaced.
 
     :param obj: Blender object
     :param start_frame: Start frame for animation
@@ -80,20 +210,30 @@ def animate_scale(obj, start_frame, end_frame, start_scale, end_scale):
     :param end_scale: Ending scale (tuple of 3 floats)
     """
     if obj:
-        insert_keyframe(obj, "scale", start_frame, start_scale)
-        insert_keyframe(obj, "scale", end_frame, end_scale)
+        # One row per axis, both keyframes written in one batch
+        bulk_insert_keyframes(obj, "scale", (start_frame, end_frame), list(zip(start_scale, end_scale)))
 
 # Add this to utils.py
 def remove_redundant_panel():
     """Try to remove redundant Animation Controls panel if it exists"""
-    for cls in bpy.types.Panel.__subclasses__():
-        if hasattr(cls, "bl_idname") and (cls.bl_idname == "ANIMATION_PT_controls" or getattr(cls, "bl_label", "") == "Animation Controls"):
-            if hasattr(bpy.types, cls.__name__):
-                try:
-                    bpy.utils.unregister_class(cls)
-                    print(f"Removed redundant panel: {cls.__name__}")
-                except:
-                    pass
+    # Registered panels are reachable on bpy.types by their bl_idname
+    cls = getattr(bpy.types, "ANIMATION_PT_controls", None)
+    if cls is not None:
+        panels = [cls]
+    else:
+        # Fall back to matching the label when the panel was registered under another id
+        panels = [cls for cls in bpy.types.Panel.__subclasses__()
+                  if getattr(cls, "bl_label", "") == "Animation Controls" and hasattr(bpy.types, cls.__name__)]
+    for cls in panels:
+        try:
+            bpy.utils.unregister_class(cls)
+            print(f"Removed redundant panel: {cls.__name__}")
+        except RuntimeError:
+            pass
+
+# Constraint and modifier types added by the animation tools
+animation_constraint_types = frozenset({'FOLLOW_PATH', 'COPY_LOCATION', 'COPY_ROTATION'})
+animation_modifier_types = frozenset({'CURVE', 'SUBSURF'})
 
 def remove_animation_effects(obj):
     """
@@ -104,22 +244,24 @@ def remove_animation_effects(obj):
     if obj is None:
         return
         
-    # Remove constraints related to animation
-    animation_constraints = ['FOLLOW_PATH', 'COPY_LOCATION', 'COPY_ROTATION']
-    for constraint in list(obj.constraints):  # Create a copy of the list to safely iterate
-        if constraint.type in animation_constraints:
-            obj.constraints.remove(constraint)
+    # Remove constraints related to animation, walking backwards so removal doesn't shift what's left
+    constraints = obj.constraints
+    for i in range(len(constraints) - 1, -1, -1):
+        constraint = constraints[i]
+        if constraint.type in animation_constraint_types:
+            constraints.remove(constraint)
             
     # Remove modifiers related to animation
-    animation_modifiers = ['CURVE', 'SUBSURF']
-    for modifier in list(obj.modifiers):  # Create a copy of the list to safely iterate
-        if modifier.type in animation_modifiers:
-            obj.modifiers.remove(modifier)
+    modifiers = obj.modifiers
+    for i in range(len(modifiers) - 1, -1, -1):
+        modifier = modifiers[i]
+        if modifier.type in animation_modifier_types:
+            modifiers.remove(modifier)
             
-    # Reset visual properties
-    if hasattr(obj, "hide_viewport"):
+    # Reset visual properties, only writing what changes
+    if getattr(obj, "hide_viewport", False):
         obj.hide_viewport = False
-    if hasattr(obj, "hide_render"):
+    if getattr(obj, "hide_render", False):
         obj.hide_render = False
 
 def register():
@@ -128,7 +270,7 @@ def register():
 
 def unregister():
     """Unregister function for Blender's add-on system."""
-    pass
+    clear_assets_folder_cache()
 
 def optimize_preview_video(input_path, output_path, target_size=256):
     """
@@ -136,66 +278,43 @@ def optimize_preview_video(input_path, output_path, target_size=256):
     1. Resizing to a square format
     2. Compressing with efficient codec
     3. Maintaining aspect ratio with padding
-    Uses Pillow instead of OpenCV.
+    Scaling and padding run in a single ffmpeg filter graph, no frame goes through Python.
     """
     try:
-        import numpy as np
-        from PIL import Image
-        from moviepy.editor import VideoFileClip
-    except ImportError:
-        print("Required packages not found. Please install pillow and moviepy.")
+        # The ffmpeg build that moviepy uses, or one on the PATH
+        from imageio_ffmpeg import get_ffmpeg_exe
+        ffmpeg = get_ffmpeg_exe()
+    except (ImportError, RuntimeError):
+        ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        print("ffmpeg not found. Please install moviepy or ffmpeg.")
         return False
 
+    # Fit inside the square maintaining aspect ratio, then center on black padding
+    video_filter = (
+        f"scale={target_size}:{target_size}:force_original_aspect_ratio=decrease:flags=lanczos,"
+        f"pad={target_size}:{target_size}:(ow-iw)/2:(oh-ih)/2:black"
+    )
+
     try:
-        # Load the video
-        video = VideoFileClip(input_path)
-        
-        # Calculate new dimensions maintaining aspect ratio
-        aspect_ratio = video.w / video.h
-        if aspect_ratio > 1:
-            # Wider than tall
-            new_width = target_size
-            new_height = int(target_size / aspect_ratio)
-        else:
-            # Taller than wide
-            new_height = target_size
-            new_width = int(target_size * aspect_ratio)
-        
-        # Create a function to resize and pad the frame using Pillow
-        def process_frame(frame):
-            # Convert frame (numpy array) to PIL Image
-            img = Image.fromarray(frame)
-            # Resize maintaining aspect ratio
-            img = img.resize((new_width, new_height), Image.LANCZOS)
-            # Create square canvas with black padding
-            square = Image.new('RGB', (target_size, target_size), (0, 0, 0))
-            # Calculate padding
-            x_offset = (target_size - new_width) // 2
-            y_offset = (target_size - new_height) // 2
-            # Paste resized image in center
-            square.paste(img, (x_offset, y_offset))
-            return np.array(square)
-        
-        # Process the video
-        processed_video = video.fl_image(process_frame)
-        
-        # Write the optimized video
-        processed_video.write_videofile(
-            output_path,
-            codec='libx264',
-            audio=False,
-            preset='ultrafast',
-            crf=28,  # Higher CRF = more compression
-            fps=video.fps
+        subprocess.run(
+            [
+                ffmpeg, "-y", "-loglevel", "error",
+                "-i", input_path,
+                "-vf", video_filter,
+                "-c:v", "libx264",
+                "-preset", "ultrafast",
+                "-crf", "28",  # Higher CRF = more compression
+                "-pix_fmt", "yuv420p",
+                "-an",
+                output_path,
+            ],
+            check=True,
+            capture_output=True,
         )
-        
-        # Clean up
-        video.close()
-        processed_video.close()
-        
         return True
         
-    except Exception as e:
+    except (OSError, subprocess.CalledProcessError) as e:
         print(f"Error optimizing video: {str(e)}")
         return False
 
@@ -215,21 +334,40 @@ def optimize_all_previews():
     if not os.path.exists(optimized_dir):
         os.makedirs(optimized_dir)
     
-    # Process each video file
-    for filename in os.listdir(preview_dir):
-        if filename.lower().endswith(('.mov', '.mp4', '.avi')):
+    filenames = [filename for filename in os.listdir(preview_dir)
+                 if filename.lower().endswith(('.mov', '.mp4', '.avi'))]
+    
+    # Process the video files in parallel, each one is an independent ffmpeg process.
+    # Threads are enough to wait on them, and ffmpeg is multithreaded itself so a
+    # quarter of the cores avoids oversubscribing the CPU
+    max_workers = max(1, (os.cpu_count() or 1) // 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for filename in filenames:
+            print(f"Optimizing {filename}...")
             input_path = os.path.join(preview_dir, filename)
             output_path = os.path.join(optimized_dir, filename)
-            
-            print(f"Optimizing {filename}...")
-            if optimize_preview_video(input_path, output_path):
+            futures[executor.submit(optimize_preview_video, input_path, output_path)] = filename
+        
+        for future in as_completed(futures):
+            filename = futures[future]
+            if future.result():
                 print(f"Successfully optimized {filename}")
             else:
                 print(f"Failed to optimize {filename}")
     
     return True
 
+# Resolved assets folder, cleared when the assets folder preference changes
+assets_folder_cache = {}
+
 def get_assets_folder():
-    import bpy
-    addon_prefs = bpy.context.preferences.addons[__package__].preferences
-    return addon_prefs.assets_folder if addon_prefs.assets_folder else os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets')
\ No newline at end of file
+    assets_folder = assets_folder_cache.get("path")
+    if assets_folder is None:
+        addon_prefs = bpy.context.preferences.addons[__package__].preferences
+        assets_folder = addon_prefs.assets_folder if addon_prefs.assets_folder else os.path.join(os.path.dirname(os.path.dirname(__file__)), 'assets')
+        assets_folder_cache["path"] = assets_folder
+    return assets_folder
+
+def clear_assets_folder_cache():
+    assets_folder_cache.clear()
\ No newline at end of file